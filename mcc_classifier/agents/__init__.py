@@ -1,4 +1,4 @@
-from mcc_classifier.agents.base_agent import MCCClassifierAgent
+from mcc_classifier.agents.base_agent import MCCClassifierAgent, ClassifyResult
 from mcc_classifier.agents.rafa_agent import RafaAgent
 from mcc_classifier.agents.matheus_agent import MatheusAgent
 from mcc_classifier.agents.waki_agent import WakiAgent
@@ -6,6 +6,7 @@ from mcc_classifier.agents.agent_factory import AgentFactory
 
 __all__ = [
     'MCCClassifierAgent',
+    'ClassifyResult',
     'RafaAgent',
     'MatheusAgent',
     'WakiAgent',
@@ -1,6 +1,39 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 import logging
 
+@dataclass(slots=True)
+class ClassifyResult:
+    """
+    Fixed-slot classification result record.
+
+    Behaves like the result dictionaries agents historically return
+    (subscripting, membership tests, get), but stores its fields in slots:
+    a slotted record is roughly half the size of the equivalent dict, which
+    matters when evaluation holds one result per (merchant, agent) pair.
+    Optional fields left as None act as absent keys.
+    """
+    mcc_code: str
+    mcc_description: str
+    confidence: float
+    alternative_mccs: list = field(default_factory=list)
+    industry_classification: str = None
+    analysis: str = None
+    reasoning: str = None
+
+    def __getitem__(self, key):
+        value = getattr(self, key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return getattr(self, key, None) is not None
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
 class MCCClassifierAgent(ABC):
     """
     Abstract base class for MCC classification agents.
@@ -36,7 +69,26 @@ class MCCClassifierAgent(ABC):
                 - 'alternative_mccs': Optional list of alternative MCCs with their confidence scores.
         """
         pass
-    
+
+    def classify_batch(self, merchants):
+        """
+        Classify a batch of merchants in one call.
+
+        The default implementation loops over classify; agents that can
+        amortize work across a batch (shared prompts, vectorized matching,
+        bulk API endpoints) should override it. A failure on any merchant
+        propagates to the caller, which may retry merchants individually.
+
+        Args:
+            merchants (list): A list of (merchant_name, legal_name) pairs.
+
+        Returns:
+            list: One classification result dict per merchant, in input order.
+        """
+        classify = self.classify
+        return [classify(merchant_name, legal_name)
+                for merchant_name, legal_name in merchants]
+
     def get_performance_metrics(self, correct_classifications, total_classifications):
         """
         Calculate performance metrics for the agent.
@@ -1,10 +1,11 @@
-from mcc_classifier.agents.base_agent import MCCClassifierAgent
+from mcc_classifier.agents.base_agent import MCCClassifierAgent, ClassifyResult
 import os
+import copy
 import csv
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List, Tuple, Optional
-import pandas as pd
 from pathlib import Path
 import json
 
@@ -15,6 +16,288 @@ except ImportError:
     OPENAI_AVAILABLE = False
     logging.warning("OpenAI package not installed. WakiAgent will use fallback classification.")
 
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    # google-re2 executes simple literal alternations as a DFA in C instead
+    # of backtracking, which is exactly the shape of the fallback bank.
+    import re2 as _regex_engine
+    RE2_AVAILABLE = True
+except ImportError:
+    _regex_engine = re
+    RE2_AVAILABLE = False
+
+# Pattern bank for fallback classification. Each entry maps a regex
+# alternation of business-name keywords to (mcc, description, confidence).
+_FALLBACK_PATTERN_RULES = [
+    # Food and dining patterns
+    (r'\b(restaurant|cafe|café|coffee|bistro|pizzeria|grill|diner|eatery|food)\b',
+     ('5812', 'Eating places and Restaurants', 0.9)),
+    (r'\b(fast food|burger|taco|sandwich|sub|quick)\b',
+     ('5814', 'Fast Food Restaurants', 0.9)),
+    (r'\b(grocery|market|supermarket|food store|supermercado|groceries)\b',
+     ('5411', 'Grocery Stores, Supermarkets', 0.9)),
+    (r'\b(convenience|mini mart|7[\s-]?eleven|corner store)\b',
+     ('5499', 'Misc. Food Stores – Convenience Stores and Specialty Markets', 0.85)),
+
+    # Retail patterns
+    (r'\b(electronics|computer|laptop|phone|mobile|tech|digital)\b',
+     ('5732', 'Electronics Sales', 0.85)),
+    (r'\b(clothing|apparel|fashion|wear|dress|outfit|garment)\b',
+     ('5651', 'Family Clothing Stores', 0.85)),
+    (r'\b(hardware|tool|diy|home improvement)\b',
+     ('5251', 'Hardware Stores', 0.85)),
+    (r'\b(furniture|home furnishing|mattress|bed|sofa|couch)\b',
+     ('5712', 'Furniture, Home Furnishings, and Equipment Stores, Except Appliances', 0.85)),
+    (r'\b(department store|general store|variety|walmart|target)\b',
+     ('5311', 'Department Stores', 0.85)),
+    (r'\b(shoe|footwear|sneaker|boot)\b',
+     ('5661', 'Shoe Stores', 0.9)),
+
+    # Services patterns
+    (r'\b(salon|barber|hair|beauty|nail|spa)\b',
+     ('7230', 'Barber and Beauty Shops', 0.9)),
+    (r'\b(repair|fix|mend|service)\b',
+     ('7699', 'Repair Shops and Related Services –Miscellaneous', 0.8)),
+    (r'\b(auto|car|vehicle|mechanic|automotive)\b',
+     ('7538', 'Automotive Service Shops', 0.9)),
+    (r'\b(hotel|motel|inn|lodging|accommodation)\b',
+     ('7011', 'Lodging – Hotels, Motels, Resorts', 0.9)),
+    (r'\b(clean|cleaning|janitorial|maid|wash|laundry)\b',
+     ('7349', 'Cleaning and Maintenance, Janitorial Services', 0.85)),
+
+    # Professional services patterns
+    (r'\b(doctor|physician|medical|clinic|health|healthcare)\b',
+     ('8011', 'Doctors and Physicians', 0.9)),
+    (r'\b(dentist|dental|orthodont|teeth|tooth)\b',
+     ('8021', 'Dentists and Orthodontists', 0.9)),
+    (r'\b(law|attorney|legal|lawyer|advocate)\b',
+     ('8111', 'Legal Services, Attorneys', 0.9)),
+    (r'\b(consult|consulting|advisor|counsel)\b',
+     ('7392', 'Management, Consulting, and Public Relations Services', 0.8)),
+    (r'\b(insurance|insure|policy|coverage)\b',
+     ('6300', 'Insurance Sales, Underwriting and Premiums', 0.85)),
+
+    # Specialty retail
+    (r'\b(pet|animal|dog|cat|bird)\b',
+     ('5995', 'Pet Shops, Pet Foods, and Supplies Stores', 0.9)),
+    (r'\b(book|comic|magazine|publication)\b',
+     ('5942', 'Bookstores', 0.9)),
+    (r'\b(pharmacy|drug|prescription|medicine|pharmaceutical)\b',
+     ('5912', 'Drug Stores and Pharmacies', 0.9)),
+    (r'\b(toy|game|hobby|play)\b',
+     ('5945', 'Hobby, Toy, and Game Shops', 0.85)),
+]
+
+# Common business types with their MCCs - used for simple keyword matching
+# when no pattern rule fires.
+_KEYWORD_MAP = {
+    'restaurant': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
+    'café': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
+    'cafe': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
+    'coffee': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
+    'pizza': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
+    'food': {'mcc': '5499', 'desc': 'Misc. Food Stores – Convenience Stores and Specialty Markets'},
+    'grocery': {'mcc': '5411', 'desc': 'Grocery Stores, Supermarkets'},
+    'market': {'mcc': '5411', 'desc': 'Grocery Stores, Supermarkets'},
+    'supermarket': {'mcc': '5411', 'desc': 'Grocery Stores, Supermarkets'},
+    'electronics': {'mcc': '5732', 'desc': 'Electronics Sales'},
+    'computer': {'mcc': '5045', 'desc': 'Computers, Computer Peripheral Equipment, Software'},
+    'software': {'mcc': '5045', 'desc': 'Computers, Computer Peripheral Equipment, Software'},
+    'hardware': {'mcc': '5251', 'desc': 'Hardware Stores'},
+    'clothing': {'mcc': '5651', 'desc': 'Family Clothing Stores'},
+    'apparel': {'mcc': '5699', 'desc': 'Miscellaneous Apparel and Accessory Shops'},
+    'fashion': {'mcc': '5699', 'desc': 'Miscellaneous Apparel and Accessory Shops'},
+    'shoe': {'mcc': '5661', 'desc': 'Shoe Stores'},
+    'footwear': {'mcc': '5661', 'desc': 'Shoe Stores'},
+    'salon': {'mcc': '7230', 'desc': 'Barber and Beauty Shops'},
+    'spa': {'mcc': '7298', 'desc': 'Health and Beauty Shops'},
+    'beauty': {'mcc': '7298', 'desc': 'Health and Beauty Shops'},
+    'barber': {'mcc': '7230', 'desc': 'Barber and Beauty Shops'},
+    'hair': {'mcc': '7230', 'desc': 'Barber and Beauty Shops'},
+    'doctor': {'mcc': '8011', 'desc': 'Doctors and Physicians'},
+    'medical': {'mcc': '8099', 'desc': 'Medical Services and Health Practitioners'},
+    'dentist': {'mcc': '8021', 'desc': 'Dentists and Orthodontists'},
+    'dental': {'mcc': '8021', 'desc': 'Dentists and Orthodontists'},
+    'clean': {'mcc': '7349', 'desc': 'Cleaning and Maintenance, Janitorial Services'},
+    'repair': {'mcc': '7699', 'desc': 'Repair Shops and Related Services –Miscellaneous'},
+    'auto': {'mcc': '7538', 'desc': 'Automotive Service Shops'},
+    'car': {'mcc': '7538', 'desc': 'Automotive Service Shops'},
+    'hotel': {'mcc': '7011', 'desc': 'Lodging – Hotels, Motels, Resorts'},
+    'motel': {'mcc': '7011', 'desc': 'Lodging – Hotels, Motels, Resorts'},
+    'pet': {'mcc': '5995', 'desc': 'Pet Shops, Pet Foods, and Supplies Stores'},
+    'toy': {'mcc': '5945', 'desc': 'Hobby, Toy, and Game Shops'}
+}
+
+# Confidence assigned to plain keyword-map hits (the original keyword path
+# returned results with 0.7 confidence).
+_KEYWORD_CONFIDENCE = 0.7
+
+# SoA layout of the keyword map: scanning parallel tuples by index avoids
+# per-iteration dict unpacking in the fallback hot loop.
+_KW_KEYS = tuple(_KEYWORD_MAP)
+_KW_MCCS = tuple(info['mcc'] for info in _KEYWORD_MAP.values())
+_KW_DESCS = tuple(info['desc'] for info in _KEYWORD_MAP.values())
+
+# Single-pass tokenization support for the keyword branch: one \w+ scan over
+# the combined text plus dict lookups replaces a substring scan per keyword,
+# and gives the same word-boundary semantics the automaton path enforces.
+# The stdlib engine is used here for its Unicode \w (the map contains 'café').
+_TOKEN_PATTERN = re.compile(r'\w+')
+_KW_INDEX = {keyword: i for i, keyword in enumerate(_KW_KEYS)}
+
+# Interned generic alternative-MCC payloads. These never vary, so the same
+# dict objects are shared across results instead of reallocated per call;
+# treat them as read-only.
+_ALT_MISC_RETAIL = {'mcc_code': '5999', 'mcc_description': 'Miscellaneous and Specialty Retail Stores', 'confidence': 0.3}
+_ALT_PERSONAL_SERVICES_LOW = {'mcc_code': '7299', 'mcc_description': 'Miscellaneous Personal Services', 'confidence': 0.2}
+_ALT_PERSONAL_SERVICES = {'mcc_code': '7299', 'mcc_description': 'Miscellaneous Personal Services', 'confidence': 0.3}
+_ALT_BUSINESS_SERVICES = {'mcc_code': '7399', 'mcc_description': 'Business Services', 'confidence': 0.2}
+
+# Industry classification by two-digit MCC prefix, with a single-digit
+# fallback for prefixes without a finer-grained bucket.
+_INDUSTRY_BY_PREFIX2 = {
+    '54': 'Food and Grocery Retail',
+    '56': 'Apparel and Accessories Retail',
+    '57': 'Home Furnishings and Electronics Retail',
+    '58': 'Restaurants and Food Service',
+    '59': 'Specialty Retail',
+    '70': 'Travel and Lodging',
+    '71': 'Travel and Lodging',
+    '72': 'Personal Services',
+    '73': 'Business and Professional Services',
+    '74': 'Repair and Maintenance Services',
+    '75': 'Auto Services',
+    '76': 'Repair and Maintenance Services',
+    '78': 'Entertainment and Recreation',
+    '79': 'Entertainment and Recreation',
+    '80': 'Healthcare',
+    '81': 'Legal Services',
+    '82': 'Educational Services',
+    '83': 'Educational Services',
+    '86': 'Membership Organizations',
+}
+
+_INDUSTRY_BY_PREFIX1 = {
+    '0': 'Contractors/Construction/Agriculture',
+    '1': 'Contractors/Construction/Agriculture',
+    '2': 'Contractors/Construction/Agriculture',
+    '3': 'Contractors/Construction/Agriculture',
+    '4': 'Transportation/Utilities',
+    '5': 'Retail/Merchants',
+    '6': 'Financial Services',
+    '7': 'Services',
+    '8': 'Professional Services',
+    '9': 'Government Services',
+}
+
+# Compile the pattern bank once at import so the fallback path never pays
+# per-call pattern-cache lookups or recompilation. The DFA-based re2 engine
+# is used when installed; the stdlib re module otherwise. Rules are ordered
+# by descending confidence so the scan can stop as soon as the top matches
+# cannot be improved on.
+_COMPILED_PATTERN_RULES = [
+    (_regex_engine.compile(pattern), payload)
+    for pattern, payload in sorted(_FALLBACK_PATTERN_RULES, key=lambda rule: rule[1][2], reverse=True)
+]
+
+def _iter_rule_keywords():
+    """
+    Yield (keyword, (mcc, description, confidence)) pairs for every literal
+    keyword in the fallback pattern bank and the keyword map.
+
+    Regex alternations are expanded into their literal alternatives; the one
+    non-literal alternative (7[\\s-]?eleven) is expanded by hand.
+    """
+    for pattern, payload in _FALLBACK_PATTERN_RULES:
+        body = pattern[len(r'\b('):-len(r')\b')]
+        for alt in body.split('|'):
+            if alt == r'7[\s-]?eleven':
+                yield from ((kw, payload) for kw in ('7 eleven', '7-eleven', '7eleven'))
+            else:
+                yield alt, payload
+
+    for keyword, mcc_info in _KEYWORD_MAP.items():
+        yield keyword, (mcc_info['mcc'], mcc_info['desc'], _KEYWORD_CONFIDENCE)
+
+
+def _build_automaton():
+    """
+    Build an Aho-Corasick automaton over all fallback keywords.
+
+    The automaton maps each keyword to (keyword_length, (mcc, description,
+    confidence)) so a single O(n) pass over the merchant text replaces the
+    ~30 regex scans plus the keyword-map loop.
+
+    Returns:
+        The compiled automaton, or None when pyahocorasick is not installed.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword, payload in _iter_rule_keywords():
+        # Pattern-bank rules come first and carry higher confidence; keep the
+        # first payload when the same keyword appears again in the keyword map.
+        if not automaton.exists(keyword):
+            automaton.add_word(keyword, (len(keyword), payload))
+    automaton.make_automaton()
+    return automaton
+
+# How long cached GPT classifications stay valid (seconds).
+CACHE_EXPIRE_SECONDS = 30 * 86400
+
+# Cap on the per-agent in-memory result memo so unbounded inputs can't bloat RSS.
+_MEMO_MAX_ENTRIES = 8192
+
+# System prompt for the GPT classification call. Hoisted to module level so
+# classify reuses one string and one message dict instead of rebuilding them
+# per call; the message dict is shared and must never be mutated.
+_SYSTEM_PROMPT = """You are an expert in merchant classification and Merchant Category Codes (MCCs) with extensive knowledge of global business types across all industries.
+
+You specialize in EXACT, ACCURATE MCC assignment according to industry standards. This is NOT a creative task - proper classification requires:
+
+1. Precise adherence to standard industry MCC assignments
+2. Avoidance of generic categories (7299, 5999) whenever possible
+3. Focus on direct business indicators in merchant names
+4. Prioritizing industry-specific codes over general alternatives
+5. Knowledge of common merchant naming patterns across sectors
+
+ACCURACY DIRECTIVES:
+- You will be evaluated on EXACT MCC CODE MATCHING
+- You must use standard industry assignments, not logical or creative alternatives
+- Generic categories should be used only when absolutely necessary
+- Most merchants can be classified by specific indicators in their names
+- Follow standard payment industry classification patterns, not your general knowledge
+
+Your goal is to match the TRUE MCC assignment according to payment industry standards.
+"""
+
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Models tried in preference order with their temperatures: very low for the
+# stronger models for deterministic results, slightly higher for GPT-3.5 but
+# still conservative.
+_MODEL_CHAIN = (
+    ("gpt-4o", 0.1),
+    ("gpt-4", 0.1),
+    ("gpt-3.5-turbo", 0.2),
+)
+
+# Detects the "Primary MCC" section of a streamed GPT response so the stream
+# can be cut short once the code downstream actually needs has arrived.
+PRIMARY_MCC_PATTERN = re.compile(r'primary mcc[^\d]{0,40}(\d{4})', re.IGNORECASE)
+
 class WakiAgent(MCCClassifierAgent):
     """
     Waki's implementation of the MCC classifier agent.
@@ -22,13 +305,34 @@ class WakiAgent(MCCClassifierAgent):
     This agent uses GPT model with a carefully crafted prompt to classify merchants with their
     appropriate MCC codes. It loads the full MCC list from CSV for comprehensive classification.
     """
-    
+
+    # Shared Aho-Corasick automaton, built lazily on first use. The _AC_BUILT
+    # flag distinguishes "not built yet" from "built but unavailable" (None
+    # when pyahocorasick is not installed) so the build runs at most once.
+    _AC = None
+    _AC_BUILT = False
+
+    @classmethod
+    def _get_automaton(cls):
+        """
+        Return the automaton shared by all WakiAgent instances, building it on first use.
+        """
+        if not cls._AC_BUILT:
+            cls._AC = _build_automaton()
+            cls._AC_BUILT = True
+        return cls._AC
+
     def __init__(self):
         """Initialize the Waki MCC classifier agent."""
         super().__init__("Waki")
-        
+
         # Load MCC data from CSV
         self.mcc_data = self._load_mcc_data()
+
+        # Multi-pattern automaton for fallback classification, shared across
+        # instances (None when pyahocorasick is not installed; the regex bank
+        # is used instead)
+        self._automaton = self._get_automaton()
         
         # Try to get API key from environment
         self.api_key = os.environ.get("OPENAI_API_KEY")
@@ -43,6 +347,43 @@ class WakiAgent(MCCClassifierAgent):
                 self.logger.info("OpenAI client initialized successfully.")
             except Exception as e:
                 self.logger.error(f"Error initializing OpenAI client: {str(e)}")
+
+        # In-process memo of classification results keyed by normalized names;
+        # short-circuits duplicate rows within a single run
+        self._memo = {}
+
+        # Initialize the persistent classification cache if diskcache is available.
+        # The same merchant names recur constantly across daily feeds, so cache
+        # hits eliminate API spend and latency for repeat merchants across runs.
+        self._cache = None
+        if DISKCACHE_AVAILABLE:
+            try:
+                cache_dir = os.environ.get("WAKI_CACHE_DIR", os.path.join("/tmp", "waki_cache"))
+                self._cache = diskcache.Cache(cache_dir, size_limit=2**30)
+                self.logger.info(f"Classification cache initialized at {cache_dir}")
+            except Exception as e:
+                self.logger.warning(f"Could not initialize classification cache: {str(e)}")
+
+    def _cache_key(self, merchant_name: str, legal_name: str, merchant_data: Dict[str, Any]) -> str:
+        """
+        Build a stable cache key for a merchant classification.
+
+        Args:
+            merchant_name: The merchant name
+            legal_name: The legal name
+            merchant_data: Additional merchant data fields
+
+        Returns:
+            A stable string key covering the primary model and the normalized
+            inputs. Only primary-model answers are cached (see
+            _classify_uncached), so the key names the primary model.
+        """
+        return "|".join([
+            _MODEL_CHAIN[0][0],
+            (merchant_name or "").strip().lower(),
+            (legal_name or "").strip().lower(),
+            str(merchant_data.get('original_mcc_code', "")).strip(),
+        ])
     
     def _load_mcc_data(self) -> Dict[str, Dict[str, str]]:
         """
@@ -59,23 +400,24 @@ class WakiAgent(MCCClassifierAgent):
             
             self.logger.info(f"Loading MCC data from {mcc_file}")
             
-            # Read CSV using pandas
-            df = pd.read_csv(mcc_file)
-            
-            # Convert to dictionary structure
-            for _, row in df.iterrows():
-                try:
-                    # Ensure MCC is treated as string and zero-padded to 4 digits
-                    mcc = str(row['mcc']).strip().zfill(4)
-                    
-                    # Store the MCC data
-                    mcc_dict[mcc] = {
-                        'description': row['description'],
-                        'classification': row['classification'] if 'classification' in row else 'Unknown'
-                    }
-                except Exception as e:
-                    self.logger.warning(f"Error processing MCC row: {str(e)}")
-                    continue
+            # Read the CSV with the stdlib csv module; pulling in pandas just
+            # for a small static file costs ~150ms of import time and tens of
+            # MB of memory in short-lived workers.
+            with open(mcc_file, 'r', newline='', encoding='utf-8') as csvfile:
+                reader = csv.DictReader(csvfile)
+                for row in reader:
+                    try:
+                        # Ensure MCC is treated as string and zero-padded to 4 digits
+                        mcc = str(row['mcc']).strip().zfill(4)
+
+                        # Store the MCC data
+                        mcc_dict[mcc] = {
+                            'description': row['description'],
+                            'classification': row.get('classification', 'Unknown')
+                        }
+                    except Exception as e:
+                        self.logger.warning(f"Error processing MCC row: {str(e)}")
+                        continue
             
             self.logger.info(f"Loaded {len(mcc_dict)} MCC codes from CSV file")
             
@@ -526,6 +868,37 @@ IMPORTANT: Remember this is a PRECISION task - your goal is to match the TRUE in
         
         return result
     
+    def _automaton_matches(self, combined_text: str) -> List[Tuple[str, str, float]]:
+        """
+        Collect fallback pattern matches with a single automaton pass.
+
+        Word-boundary semantics of the original regex bank are preserved by
+        checking that the characters surrounding each hit are not part of a
+        word. When the same MCC matches more than once, the highest-confidence
+        payload wins.
+
+        Args:
+            combined_text: Lowercased merchant + legal name text
+
+        Returns:
+            List of (mcc, description, confidence) tuples sorted by descending confidence
+        """
+        best_by_mcc = {}
+        for end_index, (keyword_length, payload) in self._automaton.iter(combined_text):
+            start_index = end_index - keyword_length + 1
+
+            # Enforce the \b semantics of the regex bank
+            if start_index > 0 and (combined_text[start_index - 1].isalnum() or combined_text[start_index - 1] == '_'):
+                continue
+            if end_index + 1 < len(combined_text) and (combined_text[end_index + 1].isalnum() or combined_text[end_index + 1] == '_'):
+                continue
+
+            mcc = payload[0]
+            if mcc not in best_by_mcc or payload[2] > best_by_mcc[mcc][2]:
+                best_by_mcc[mcc] = payload
+
+        return sorted(best_by_mcc.values(), key=lambda x: x[2], reverse=True)
+
     def _fallback_classify(self, merchant_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Fallback classification method when GPT is not available.
@@ -543,86 +916,38 @@ IMPORTANT: Remember this is a PRECISION task - your goal is to match the TRUE in
         
         # If original MCC is provided and it's valid, use it with reduced confidence
         if original_mcc and original_mcc in self.mcc_data:
-            return {
-                'mcc_code': original_mcc,
-                'mcc_description': self.mcc_data[original_mcc]['description'],
-                'confidence': 0.7,
-                'alternative_mccs': [
-                    {'mcc_code': '5999', 'mcc_description': 'Miscellaneous and Specialty Retail Stores', 'confidence': 0.3},
-                    {'mcc_code': '7299', 'mcc_description': 'Miscellaneous Personal Services', 'confidence': 0.2}
-                ],
-                'industry_classification': self._determine_industry(original_mcc),
-                'analysis': 'Using provided original MCC code',
-                'reasoning': 'Classification based on original MCC code'
-            }
+            return ClassifyResult(
+                mcc_code=original_mcc,
+                mcc_description=self.mcc_data[original_mcc]['description'],
+                confidence=0.7,
+                alternative_mccs=[_ALT_MISC_RETAIL, _ALT_PERSONAL_SERVICES_LOW],
+                industry_classification=self._determine_industry(original_mcc),
+                analysis='Using provided original MCC code',
+                reasoning='Classification based on original MCC code'
+            )
         
-        # Simple keyword-based classification
-        merchant_name_lower = merchant_name.lower()
-        legal_name_lower = legal_name.lower() if legal_name else ''
-        
-        # Combine both names for classification
-        combined_text = f"{merchant_name_lower} {legal_name_lower}"
+        # Simple keyword-based classification. Combine both names and case-fold
+        # once; every pattern and keyword in the bank is stored lowercase, so no
+        # further case handling is paid during matching.
+        combined_text = f"{merchant_name} {legal_name or ''}".lower()
         
         # Pattern matching for common business types
         pattern_matches = []
-        
-        # Food and dining patterns
-        if re.search(r'\b(restaurant|cafe|café|coffee|bistro|pizzeria|grill|diner|eatery|food)\b', combined_text):
-            pattern_matches.append(('5812', 'Eating places and Restaurants', 0.9))
-        if re.search(r'\b(fast food|burger|taco|sandwich|sub|quick)\b', combined_text):
-            pattern_matches.append(('5814', 'Fast Food Restaurants', 0.9))
-        if re.search(r'\b(grocery|market|supermarket|food store|supermercado|groceries)\b', combined_text):
-            pattern_matches.append(('5411', 'Grocery Stores, Supermarkets', 0.9))
-        if re.search(r'\b(convenience|mini mart|7[\s-]?eleven|corner store)\b', combined_text):
-            pattern_matches.append(('5499', 'Misc. Food Stores – Convenience Stores and Specialty Markets', 0.85))
-        
-        # Retail patterns
-        if re.search(r'\b(electronics|computer|laptop|phone|mobile|tech|digital)\b', combined_text):
-            pattern_matches.append(('5732', 'Electronics Sales', 0.85))
-        if re.search(r'\b(clothing|apparel|fashion|wear|dress|outfit|garment)\b', combined_text):
-            pattern_matches.append(('5651', 'Family Clothing Stores', 0.85))
-        if re.search(r'\b(hardware|tool|diy|home improvement)\b', combined_text):
-            pattern_matches.append(('5251', 'Hardware Stores', 0.85))
-        if re.search(r'\b(furniture|home furnishing|mattress|bed|sofa|couch)\b', combined_text):
-            pattern_matches.append(('5712', 'Furniture, Home Furnishings, and Equipment Stores, Except Appliances', 0.85))
-        if re.search(r'\b(department store|general store|variety|walmart|target)\b', combined_text):
-            pattern_matches.append(('5311', 'Department Stores', 0.85))
-        if re.search(r'\b(shoe|footwear|sneaker|boot)\b', combined_text):
-            pattern_matches.append(('5661', 'Shoe Stores', 0.9))
-        
-        # Services patterns
-        if re.search(r'\b(salon|barber|hair|beauty|nail|spa)\b', combined_text):
-            pattern_matches.append(('7230', 'Barber and Beauty Shops', 0.9))
-        if re.search(r'\b(repair|fix|mend|service)\b', combined_text):
-            pattern_matches.append(('7699', 'Repair Shops and Related Services –Miscellaneous', 0.8))
-        if re.search(r'\b(auto|car|vehicle|mechanic|automotive)\b', combined_text):
-            pattern_matches.append(('7538', 'Automotive Service Shops', 0.9))
-        if re.search(r'\b(hotel|motel|inn|lodging|accommodation)\b', combined_text):
-            pattern_matches.append(('7011', 'Lodging – Hotels, Motels, Resorts', 0.9))
-        if re.search(r'\b(clean|cleaning|janitorial|maid|wash|laundry)\b', combined_text):
-            pattern_matches.append(('7349', 'Cleaning and Maintenance, Janitorial Services', 0.85))
-        
-        # Professional services patterns
-        if re.search(r'\b(doctor|physician|medical|clinic|health|healthcare)\b', combined_text):
-            pattern_matches.append(('8011', 'Doctors and Physicians', 0.9))
-        if re.search(r'\b(dentist|dental|orthodont|teeth|tooth)\b', combined_text):
-            pattern_matches.append(('8021', 'Dentists and Orthodontists', 0.9))
-        if re.search(r'\b(law|attorney|legal|lawyer|advocate)\b', combined_text):
-            pattern_matches.append(('8111', 'Legal Services, Attorneys', 0.9))
-        if re.search(r'\b(consult|consulting|advisor|counsel)\b', combined_text):
-            pattern_matches.append(('7392', 'Management, Consulting, and Public Relations Services', 0.8))
-        if re.search(r'\b(insurance|insure|policy|coverage)\b', combined_text):
-            pattern_matches.append(('6300', 'Insurance Sales, Underwriting and Premiums', 0.85))
-        
-        # Specialty retail
-        if re.search(r'\b(pet|animal|dog|cat|bird)\b', combined_text):
-            pattern_matches.append(('5995', 'Pet Shops, Pet Foods, and Supplies Stores', 0.9))
-        if re.search(r'\b(book|comic|magazine|publication)\b', combined_text):
-            pattern_matches.append(('5942', 'Bookstores', 0.9))
-        if re.search(r'\b(pharmacy|drug|prescription|medicine|pharmaceutical)\b', combined_text):
-            pattern_matches.append(('5912', 'Drug Stores and Pharmacies', 0.9))
-        if re.search(r'\b(toy|game|hobby|play)\b', combined_text):
-            pattern_matches.append(('5945', 'Hobby, Toy, and Game Shops', 0.85))
+
+        if self._automaton is not None:
+            # Single O(n+z) automaton pass replaces the per-rule regex scans
+            # and the keyword-map loop below
+            pattern_matches = self._automaton_matches(combined_text)
+        else:
+            # Scan the precompiled pattern bank (used when pyahocorasick is
+            # not installed). The bank is ordered by descending confidence, so
+            # the first three hits are already the best three - only the top
+            # match plus two alternatives are ever used, so stop there.
+            for pattern, payload in _COMPILED_PATTERN_RULES:
+                if pattern.search(combined_text):
+                    pattern_matches.append(payload)
+                    if len(pattern_matches) >= 3:
+                        break
         
         # If we have pattern matches, use the one with highest confidence
         if pattern_matches:
@@ -642,119 +967,153 @@ IMPORTANT: Remember this is a PRECISION task - your goal is to match the TRUE in
             # Add generic fallbacks if needed
             while len(alternative_mccs) < 2:
                 if top_match[0] != '5999':
-                    alternative_mccs.append({
-                        'mcc_code': '5999',
-                        'mcc_description': 'Miscellaneous and Specialty Retail Stores',
-                        'confidence': 0.3
-                    })
+                    alternative_mccs.append(_ALT_MISC_RETAIL)
                     break
                 if top_match[0] != '7299':
-                    alternative_mccs.append({
-                        'mcc_code': '7299',
-                        'mcc_description': 'Miscellaneous Personal Services',
-                        'confidence': 0.3
-                    })
+                    alternative_mccs.append(_ALT_PERSONAL_SERVICES)
                     break
             
-            return {
-                'mcc_code': top_match[0],
-                'mcc_description': top_match[1],
-                'confidence': top_match[2],
-                'alternative_mccs': alternative_mccs,
-                'industry_classification': self._determine_industry(top_match[0]),
-                'analysis': f'Identified business type from name patterns',
-                'reasoning': f'Pattern matching identified keywords related to {top_match[1]}'
-            }
+            return ClassifyResult(
+                mcc_code=top_match[0],
+                mcc_description=top_match[1],
+                confidence=top_match[2],
+                alternative_mccs=alternative_mccs,
+                industry_classification=self._determine_industry(top_match[0]),
+                analysis=f'Identified business type from name patterns',
+                reasoning=f'Pattern matching identified keywords related to {top_match[1]}'
+            )
         
-        # Common business types with their MCCs - fallback to simple keyword matching
-        keyword_map = {
-            'restaurant': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
-            'café': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
-            'cafe': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
-            'coffee': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
-            'pizza': {'mcc': '5812', 'desc': 'Eating places and Restaurants'},
-            'food': {'mcc': '5499', 'desc': 'Misc. Food Stores – Convenience Stores and Specialty Markets'},
-            'grocery': {'mcc': '5411', 'desc': 'Grocery Stores, Supermarkets'},
-            'market': {'mcc': '5411', 'desc': 'Grocery Stores, Supermarkets'},
-            'supermarket': {'mcc': '5411', 'desc': 'Grocery Stores, Supermarkets'},
-            'electronics': {'mcc': '5732', 'desc': 'Electronics Sales'},
-            'computer': {'mcc': '5045', 'desc': 'Computers, Computer Peripheral Equipment, Software'},
-            'software': {'mcc': '5045', 'desc': 'Computers, Computer Peripheral Equipment, Software'},
-            'hardware': {'mcc': '5251', 'desc': 'Hardware Stores'},
-            'clothing': {'mcc': '5651', 'desc': 'Family Clothing Stores'},
-            'apparel': {'mcc': '5699', 'desc': 'Miscellaneous Apparel and Accessory Shops'},
-            'fashion': {'mcc': '5699', 'desc': 'Miscellaneous Apparel and Accessory Shops'},
-            'shoe': {'mcc': '5661', 'desc': 'Shoe Stores'},
-            'footwear': {'mcc': '5661', 'desc': 'Shoe Stores'},
-            'salon': {'mcc': '7230', 'desc': 'Barber and Beauty Shops'},
-            'spa': {'mcc': '7298', 'desc': 'Health and Beauty Shops'},
-            'beauty': {'mcc': '7298', 'desc': 'Health and Beauty Shops'},
-            'barber': {'mcc': '7230', 'desc': 'Barber and Beauty Shops'},
-            'hair': {'mcc': '7230', 'desc': 'Barber and Beauty Shops'},
-            'doctor': {'mcc': '8011', 'desc': 'Doctors and Physicians'},
-            'medical': {'mcc': '8099', 'desc': 'Medical Services and Health Practitioners'},
-            'dentist': {'mcc': '8021', 'desc': 'Dentists and Orthodontists'},
-            'dental': {'mcc': '8021', 'desc': 'Dentists and Orthodontists'},
-            'clean': {'mcc': '7349', 'desc': 'Cleaning and Maintenance, Janitorial Services'},
-            'repair': {'mcc': '7699', 'desc': 'Repair Shops and Related Services –Miscellaneous'},
-            'auto': {'mcc': '7538', 'desc': 'Automotive Service Shops'},
-            'car': {'mcc': '7538', 'desc': 'Automotive Service Shops'},
-            'hotel': {'mcc': '7011', 'desc': 'Lodging – Hotels, Motels, Resorts'},
-            'motel': {'mcc': '7011', 'desc': 'Lodging – Hotels, Motels, Resorts'},
-            'pet': {'mcc': '5995', 'desc': 'Pet Shops, Pet Foods, and Supplies Stores'},
-            'toy': {'mcc': '5945', 'desc': 'Hobby, Toy, and Game Shops'}
-        }
-        
-        # Look for keywords in merchant name
-        for keyword, mcc_info in keyword_map.items():
-            if keyword in combined_text:
-                return {
-                    'mcc_code': mcc_info['mcc'],
-                    'mcc_description': mcc_info['desc'],
-                    'confidence': 0.7,
-                    'alternative_mccs': [
-                        {'mcc_code': '5999', 'mcc_description': 'Miscellaneous and Specialty Retail Stores', 'confidence': 0.3},
-                        {'mcc_code': '7299', 'mcc_description': 'Miscellaneous Personal Services', 'confidence': 0.2}
-                    ],
-                    'industry_classification': self._determine_industry(mcc_info['mcc']),
-                    'analysis': f'Found keyword "{keyword}" in merchant name',
-                    'reasoning': f'Keyword matching identified "{keyword}" related to {mcc_info["desc"]}'
-                }
+        # Look for keywords in merchant name. The automaton pass above
+        # already covers the keyword map, so this only runs on the regex path.
+        if self._automaton is None:
+            # Tokenize once and resolve tokens against the keyword index
+            # rather than scanning the text per keyword. The earliest map
+            # entry keeps priority, and a trailing 's' is folded so plural
+            # forms still reach their singular keyword.
+            hit = None
+            for token in _TOKEN_PATTERN.findall(combined_text):
+                i = _KW_INDEX.get(token)
+                if i is None and token.endswith('s'):
+                    i = _KW_INDEX.get(token[:-1])
+                if i is not None and (hit is None or i < hit):
+                    hit = i
+
+            if hit is not None:
+                keyword = _KW_KEYS[hit]
+                return ClassifyResult(
+                    mcc_code=_KW_MCCS[hit],
+                    mcc_description=_KW_DESCS[hit],
+                    confidence=0.7,
+                    alternative_mccs=[_ALT_MISC_RETAIL, _ALT_PERSONAL_SERVICES_LOW],
+                    industry_classification=self._determine_industry(_KW_MCCS[hit]),
+                    analysis=f'Found keyword "{keyword}" in merchant name',
+                    reasoning=f'Keyword matching identified "{keyword}" related to {_KW_DESCS[hit]}'
+                )
         
         # Default fallback - try to use the first word of the merchant name to guess personal vs. business service
         if ' ' in merchant_name and len(merchant_name.split(' ')[0]) > 2:
             # If merchant name starts with what looks like a person's name, likely a service
-            return {
-                'mcc_code': '7299',
-                'mcc_description': 'Miscellaneous Personal Services',
-                'confidence': 0.6,
-                'alternative_mccs': [
-                    {'mcc_code': '5999', 'mcc_description': 'Miscellaneous and Specialty Retail Stores', 'confidence': 0.3},
-                    {'mcc_code': '7399', 'mcc_description': 'Business Services', 'confidence': 0.2}
-                ],
-                'industry_classification': 'Services',
-                'analysis': 'Unable to identify specific business type from name',
-                'reasoning': 'Name suggests a personal or professional service business'
-            }
+            return ClassifyResult(
+                mcc_code='7299',
+                mcc_description='Miscellaneous Personal Services',
+                confidence=0.6,
+                alternative_mccs=[_ALT_MISC_RETAIL, _ALT_BUSINESS_SERVICES],
+                industry_classification='Services',
+                analysis='Unable to identify specific business type from name',
+                reasoning='Name suggests a personal or professional service business'
+            )
         else:
             # Default to retail as slightly more common
-            return {
-                'mcc_code': '5999',
-                'mcc_description': 'Miscellaneous and Specialty Retail Stores',
-                'confidence': 0.6,
-                'alternative_mccs': [
-                    {'mcc_code': '7299', 'mcc_description': 'Miscellaneous Personal Services', 'confidence': 0.3},
-                    {'mcc_code': '7399', 'mcc_description': 'Business Services', 'confidence': 0.2}
-                ],
-                'industry_classification': 'Retail/Merchants',
-                'analysis': 'Unable to identify specific business type from name',
-                'reasoning': 'Defaulting to retail classification based on statistical prevalence'
-            }
+            return ClassifyResult(
+                mcc_code='5999',
+                mcc_description='Miscellaneous and Specialty Retail Stores',
+                confidence=0.6,
+                alternative_mccs=[_ALT_PERSONAL_SERVICES, _ALT_BUSINESS_SERVICES],
+                industry_classification='Retail/Merchants',
+                analysis='Unable to identify specific business type from name',
+                reasoning='Defaulting to retail classification based on statistical prevalence'
+            )
     
+    def _request_completion_text(self, model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+        """
+        Request a chat completion as a stream and return the accumulated text.
+
+        The model produces a multi-section response (Analysis, Reasoning,
+        Alternatives, ...) but downstream only strictly needs the primary MCC
+        and its description. Once the "Primary MCC" section has streamed in
+        and enough surrounding context has accumulated, the stream is closed
+        early, cutting generated-token count and latency on long responses.
+        Set WAKI_EARLY_STOP=0 to always consume the full response.
+
+        Args:
+            model: The model name to use for the completion
+            messages: The chat messages to send
+            temperature: Sampling temperature
+
+        Returns:
+            The (possibly truncated) response text.
+        """
+        stream = self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True
+        )
+
+        early_stop = os.environ.get('WAKI_EARLY_STOP', '1') == '1'
+        text_buf = ""
+        mcc_found = False
+
+        for chunk in stream:
+            text_buf += chunk.choices[0].delta.content or ''
+
+            if not mcc_found and PRIMARY_MCC_PATTERN.search(text_buf):
+                mcc_found = True
+
+            # Keep reading a little past the primary MCC so its description
+            # line is captured, then abort the connection.
+            if early_stop and mcc_found and len(text_buf) > 400:
+                stream.close()
+                self.logger.debug(f"Early-stopped GPT stream after {len(text_buf)} characters")
+                break
+
+        return text_buf
+
+    def classify_batch_fallback(self, merchants: List[Dict[str, Any]], n_workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Classify a batch of merchants using the fallback path across a process pool.
+
+        The fallback classification is pure-Python CPU work (regex and dictionary
+        lookups) with no shared mutable state, so large offline batches scale
+        near-linearly with the number of worker processes.
+
+        Args:
+            merchants: List of merchant data dictionaries (same shape as the
+                argument to _fallback_classify).
+            n_workers (int, optional): Number of worker processes. Defaults to
+                the number of CPUs.
+
+        Returns:
+            List of classification result dictionaries, in input order.
+        """
+        self.logger.info(f"Running fallback classification for {len(merchants)} merchants in parallel")
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            # A large chunksize keeps per-task IPC overhead below the
+            # per-merchant classification work.
+            return list(executor.map(self._fallback_classify, merchants, chunksize=64))
+
+    def __getstate__(self):
+        """Return picklable state for use in worker processes (drops the OpenAI client and cache)."""
+        state = self.__dict__.copy()
+        state['client'] = None
+        state['_cache'] = None
+        return state
+
     def classify(self, merchant_name, legal_name=None, **merchant_data):
         """
         Classify a merchant using Waki's algorithm.
-        
+
         Args:
             merchant_name (str): The name of the merchant.
             legal_name (str, optional): The legal name of the merchant.
@@ -763,7 +1122,40 @@ IMPORTANT: Remember this is a PRECISION task - your goal is to match the TRUE in
                 - mcc_description: Description of the original MCC
                 - ai_original_description: AI's original description
                 - And any other fields available in the merchant record
-            
+
+        Returns:
+            dict: Classification result with suggested MCC and confidence.
+        """
+        # Duplicate merchants are common (same chain, many locations), so reuse
+        # the in-process result instead of re-paying an API call or regex scan.
+        # The original MCC code is part of the key because the fallback path
+        # returns it directly when valid, so it changes the answer
+        memo_key = (
+            (merchant_name or "").strip().lower(),
+            (legal_name or "").strip().lower(),
+            str(merchant_data.get('original_mcc_code', "")).strip(),
+        )
+        memoized = self._memo.get(memo_key)
+        if memoized is not None:
+            self.logger.info(f"Reusing in-memory result for merchant: {merchant_name}")
+            return copy.deepcopy(memoized)
+
+        result = self._classify_uncached(merchant_name, legal_name, **merchant_data)
+
+        if len(self._memo) < _MEMO_MAX_ENTRIES:
+            self._memo[memo_key] = copy.deepcopy(result)
+
+        return result
+
+    def _classify_uncached(self, merchant_name, legal_name=None, **merchant_data):
+        """
+        Run the full classification pipeline without consulting the in-memory memo.
+
+        Args:
+            merchant_name (str): The name of the merchant.
+            legal_name (str, optional): The legal name of the merchant.
+            **merchant_data: Additional merchant data fields.
+
         Returns:
             dict: Classification result with suggested MCC and confidence.
         """
@@ -780,7 +1172,16 @@ IMPORTANT: Remember this is a PRECISION task - your goal is to match the TRUE in
         if not OPENAI_AVAILABLE or not self.client:
             self.logger.warning("OpenAI client not available. Using fallback classification.")
             return self._fallback_classify(full_merchant_data)
-        
+
+        # Check the persistent cache before paying for an API call
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache_key(merchant_name, legal_name, merchant_data)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Cache hit for merchant: {merchant_name}")
+                return copy.deepcopy(cached)
+
         try:
             # Create the prompt
             prompt = self._create_prompt(full_merchant_data)
@@ -788,61 +1189,27 @@ IMPORTANT: Remember this is a PRECISION task - your goal is to match the TRUE in
             # Make the API call
             self.logger.info(f"Sending request to GPT for merchant: {merchant_name}")
             
-            system_prompt = """You are an expert in merchant classification and Merchant Category Codes (MCCs) with extensive knowledge of global business types across all industries.
-
-You specialize in EXACT, ACCURATE MCC assignment according to industry standards. This is NOT a creative task - proper classification requires:
-
-1. Precise adherence to standard industry MCC assignments
-2. Avoidance of generic categories (7299, 5999) whenever possible
-3. Focus on direct business indicators in merchant names
-4. Prioritizing industry-specific codes over general alternatives
-5. Knowledge of common merchant naming patterns across sectors
-
-ACCURACY DIRECTIVES:
-- You will be evaluated on EXACT MCC CODE MATCHING
-- You must use standard industry assignments, not logical or creative alternatives
-- Generic categories should be used only when absolutely necessary
-- Most merchants can be classified by specific indicators in their names
-- Follow standard payment industry classification patterns, not your general knowledge
+            messages = [
+                _SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt}
+            ]
 
-Your goal is to match the TRUE MCC assignment according to payment industry standards.
-"""
-            
-            try:
-                response = self.client.chat.completions.create(
-                    model="gpt-4o",  # Use GPT-4o for better results
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.1  # Very low temperature for more consistent, deterministic results
-                )
-            except Exception as model_error:
-                # If GPT-4o fails, try GPT-4 or GPT-3.5-turbo as fallback
-                self.logger.warning(f"Failed to use GPT-4o, falling back to GPT-4: {str(model_error)}")
+            # Walk the model chain flat rather than through nested try/except
+            # blocks; each nesting level cost an extra traceback build whenever
+            # the primary model was rate-limited
+            last_error = None
+            serving_model = None
+            for model, temperature in _MODEL_CHAIN:
                 try:
-                    response = self.client.chat.completions.create(
-                        model="gpt-4",  # Fallback to GPT-4
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.1
-                    )
-                except Exception as fallback_error:
-                    # If GPT-4 also fails, try GPT-3.5-turbo
-                    self.logger.warning(f"Failed to use GPT-4, falling back to GPT-3.5-turbo: {str(fallback_error)}")
-                    response = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",  # Last resort fallback
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.2  # Slightly higher for GPT-3.5 but still conservative
-                    )
-            
-            # Extract the response text
-            response_text = response.choices[0].message.content
+                    response_text = self._request_completion_text(model, messages, temperature=temperature)
+                    serving_model = model
+                    break
+                except Exception as model_error:
+                    self.logger.warning(f"Failed to use {model}, trying next fallback: {str(model_error)}")
+                    last_error = model_error
+            else:
+                raise last_error
+
             self.logger.debug(f"GPT response: {response_text}")
             
             # Parse the response
@@ -850,7 +1217,14 @@ Your goal is to match the TRUE MCC assignment according to payment industry stan
             
             # Log the classification result
             self.logger.info(f"Classified '{merchant_name}' as MCC {result['mcc_code']} - {result['mcc_description']} with confidence {result['confidence']}")
-            
+
+            # Store the result so repeat merchants skip the API entirely.
+            # Fallback-model answers are weaker and would otherwise mask the
+            # primary model for the full expiry window, so only cache when the
+            # primary model served the response
+            if cache_key is not None and serving_model == _MODEL_CHAIN[0][0]:
+                self._cache.set(cache_key, result, expire=CACHE_EXPIRE_SECONDS)
+
             return result
                 
         except Exception as e:
@@ -870,63 +1244,8 @@ Your goal is to match the TRUE MCC assignment according to payment industry stan
         """
         if not mcc or len(mcc) < 2:
             return "Unknown"
-            
-        # First digit of MCC code generally indicates the industry
-        first_digit = mcc[0]
-        
-        # Major industry classifications
-        if first_digit == '5':
-            # Further classify retail
-            if mcc.startswith('54'):
-                return "Food and Grocery Retail"
-            elif mcc.startswith('56'):
-                return "Apparel and Accessories Retail"
-            elif mcc.startswith('57'):
-                return "Home Furnishings and Electronics Retail"
-            elif mcc.startswith('58'):
-                return "Restaurants and Food Service"
-            elif mcc.startswith('59'):
-                return "Specialty Retail"
-            else:
-                return "Retail/Merchants"
-                
-        elif first_digit == '7':
-            # Further classify services
-            if mcc.startswith('70') or mcc.startswith('71'):
-                return "Travel and Lodging"
-            elif mcc.startswith('72'):
-                return "Personal Services"
-            elif mcc.startswith('73'):
-                return "Business and Professional Services"
-            elif mcc.startswith('74') or mcc.startswith('76'):
-                return "Repair and Maintenance Services"
-            elif mcc.startswith('75'):
-                return "Auto Services"
-            elif mcc.startswith('78') or mcc.startswith('79'):
-                return "Entertainment and Recreation"
-            else:
-                return "Services"
-                
-        elif first_digit == '8':
-            # Further classify professional services
-            if mcc.startswith('80'):
-                return "Healthcare"
-            elif mcc.startswith('81'):
-                return "Legal Services"
-            elif mcc.startswith('82') or mcc.startswith('83'):
-                return "Educational Services"
-            elif mcc.startswith('86'):
-                return "Membership Organizations"
-            else:
-                return "Professional Services"
-                
-        elif first_digit == '4':
-            return "Transportation/Utilities"
-        elif first_digit == '6':
-            return "Financial Services"
-        elif first_digit == '9':
-            return "Government Services"
-        elif first_digit in ['0', '1', '2', '3']:
-            return "Contractors/Construction/Agriculture"
-        else:
-            return "Other Business Categories" 
\ No newline at end of file
+
+        # Two-digit prefix is the most specific bucket; fall back to the
+        # single-digit industry, then to the generic category.
+        return (_INDUSTRY_BY_PREFIX2.get(mcc[:2])
+                or _INDUSTRY_BY_PREFIX1.get(mcc[0], "Other Business Categories"))
\ No newline at end of file
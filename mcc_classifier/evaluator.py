@@ -1,13 +1,86 @@
 import logging
+import multiprocessing
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
+import numpy as np
+
 from mcc_classifier.agents.agent_factory import AgentFactory
 from mcc_classifier.agents.base_agent import MCCClassifierAgent
-from mcc_classifier.utils.data_handler import DataHandler
+from mcc_classifier.utils.data_handler import DataHandler, MCC_INPUT_DTYPES
 
 logger = logging.getLogger("mcc_classifier.evaluator")
 
+# Row counts below this use the plain-Python validity filter; the vectorized
+# pandas mask only pays off once it amortizes building the frame
+_VECTOR_FILTER_MIN_ROWS = 1024
+
+# Optional JIT for the match-counting reduction on very large runs
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _sum_matches_jit(mask):
+        count = 0
+        for i in prange(mask.size):
+            count += 1 if mask[i] else 0
+        return count
+
+# Below this many rows the JIT dispatch overhead exceeds what it saves over
+# numpy's own C reduction
+_JIT_MIN_ROWS = 10_000
+
+def _sum_matches(mask) -> int:
+    """
+    Count the True entries of a boolean match mask.
+
+    Uses the numba-parallel reduction when it is installed and the mask is
+    large enough to amortize the JIT dispatch; numpy's C sum otherwise.
+    """
+    if NUMBA_AVAILABLE and mask.size > _JIT_MIN_ROWS:
+        return int(_sum_matches_jit(mask))
+    return int(mask.sum())
+
+# Worker-local agent instances for evaluate_parallel; each pool worker builds
+# its own agents (and their precompiled pattern banks) once in the initializer.
+_WORKER_AGENTS = None
+
+def _init_worker(agent_types):
+    """
+    Pool initializer: construct this worker's own agent instances.
+
+    Args:
+        agent_types (list): Agent type strings accepted by AgentFactory.create_agent.
+    """
+    global _WORKER_AGENTS
+    _WORKER_AGENTS = [AgentFactory.create_agent(agent_type) for agent_type in agent_types]
+
+def _classify_row(task):
+    """
+    Classify one merchant with every worker-local agent.
+
+    Args:
+        task (tuple): A (merchant_name, legal_name) pair.
+
+    Returns:
+        list: One entry per agent - the result dict, or the exception raised.
+    """
+    merchant_name, legal_name = task
+    results = []
+    for agent in _WORKER_AGENTS:
+        try:
+            results.append(agent.classify(merchant_name, legal_name))
+        except Exception as e:
+            logger.error(f"Error classifying merchant {merchant_name} with agent {agent.name}: {str(e)}")
+            results.append(e)
+    return results
+
 class MCCEvaluator:
     """
     Main class for evaluating MCC classification agents.
@@ -25,20 +98,254 @@ class MCCEvaluator:
                 If not provided, all available agents will be used.
         """
         self.agents = agents or AgentFactory.create_all_agents()
+
+        # Output column names per agent, computed once instead of re-running
+        # four f-strings per agent on every merchant row
+        self._agent_columns = {
+            agent.name: (
+                f"{agent.name}'s suggested MCC",
+                f"{agent.name}'s MCC description",
+                f"{agent.name}'s confidence",
+                f"{agent.name}'s match"
+            )
+            for agent in self.agents
+        }
+
+        # Flat (name, columns...) tuples in agent order so the per-row
+        # assembly loop unpacks locals instead of doing dict lookups
+        self._agent_layout = [
+            (agent.name,) + self._agent_columns[agent.name] for agent in self.agents
+        ]
+
         logger.info(f"Initialized MCC evaluator with {len(self.agents)} agents")
     
-    def evaluate(self, input_file: str, output_file: str, pass_full_data: bool = False) -> Dict[str, Any]:
+    def _classify_task(self, agent: MCCClassifierAgent, merchant_name: str, legal_name: str,
+                       additional_data: Dict[str, Any], pass_full_data: bool) -> Any:
+        """
+        Run a single agent classification, capturing any failure as the exception object.
+
+        Args:
+            agent: The agent to classify with.
+            merchant_name (str): The merchant name.
+            legal_name (str): The legal name of the merchant.
+            additional_data (dict): Extra merchant fields to pass when pass_full_data is set.
+            pass_full_data (bool): Whether to pass full merchant data to the agent.
+
+        Returns:
+            The classification result dict, or the raised exception on failure.
+        """
+        try:
+            if pass_full_data:
+                try:
+                    # First try with full data
+                    return agent.classify(merchant_name, legal_name, **additional_data)
+                except TypeError:
+                    # If the agent doesn't support full data, fall back to basic parameters
+                    logger.info(f"Agent {agent.name} doesn't support full data, falling back to basic parameters")
+                    return agent.classify(merchant_name, legal_name)
+            # Use the simple classify method with just merchant name and legal name
+            return agent.classify(merchant_name, legal_name)
+        except Exception as e:
+            logger.error(f"Error classifying merchant {merchant_name} with agent {agent.name}: {str(e)}")
+            return e
+
+    @staticmethod
+    def _filter_valid(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop rows missing a merchant name or actual MCC code.
+
+        Large inputs run the check as two vectorized pandas masks over the
+        whole batch instead of one Python comparison per row; small batches
+        keep the plain loop, which is cheaper than building a frame.
+
+        Args:
+            rows (list): Raw merchant row dictionaries.
+
+        Returns:
+            list: The rows that have both required fields, in input order.
+        """
+        if len(rows) < _VECTOR_FILTER_MIN_ROWS:
+            valid_rows = []
+            for merchant in rows:
+                if not merchant.get("Merchant Name", "") or not merchant.get("Actual MCC code", ""):
+                    logger.warning(f"Skipping row with missing data: {merchant}")
+                    continue
+                valid_rows.append(merchant)
+            return valid_rows
+
+        import pandas as pd
+
+        df = pd.DataFrame(rows)
+        for column in ("Merchant Name", "Actual MCC code"):
+            if column not in df.columns:
+                df[column] = ""
+        mask = ((df["Merchant Name"].fillna("").astype(str).str.len() > 0)
+                & (df["Actual MCC code"].fillna("").astype(str).str.len() > 0))
+        mask_values = mask.to_numpy()
+
+        skipped = len(rows) - int(mask_values.sum())
+        if skipped:
+            logger.warning(f"Skipping {skipped} rows with missing data")
+
+        return [row for row, keep in zip(rows, mask_values) if keep]
+
+    @staticmethod
+    def _match_masks(actual_mccs: List[str], results_by_agent: List[List[Any]]) -> List[Any]:
+        """
+        Compare suggested and actual MCC codes with one vectorized pass per agent.
+
+        numpy compares the fixed-width string arrays in a single C loop
+        instead of a Python equality per (merchant, agent) pair. Exceptions
+        contribute an empty prediction, which never matches a validated
+        (hence non-empty) actual code.
+
+        Args:
+            actual_mccs (list): The stripped actual MCC code per merchant.
+            results_by_agent (list): Per-agent result-or-exception lists.
+
+        Returns:
+            list: One boolean numpy array per agent, aligned with the rows.
+        """
+        actual = np.asarray(actual_mccs, dtype=str)
+        masks = []
+        for agent_results in results_by_agent:
+            predicted = ["" if isinstance(result, Exception) else str(result["mcc_code"])
+                         for result in agent_results]
+            masks.append(np.char.strip(np.asarray(predicted, dtype=str)) == actual)
+        return masks
+
+    def _run_agent(self, agent: MCCClassifierAgent, valid_merchants: List[tuple],
+                   pass_full_data: bool) -> List[Any]:
+        """
+        Classify every collected merchant with one agent.
+
+        Uses the agent's classify_batch entry point when no extra merchant
+        data needs to be threaded through, costing one Python call per batch
+        instead of per row. If the batch raises, or full data is requested,
+        merchants are classified individually so a failure only produces an
+        ERROR row for its own merchant.
+
+        Args:
+            agent: The agent to classify with.
+            valid_merchants (list): Collected merchant tuples from evaluate.
+            pass_full_data (bool): Whether to pass full merchant data to the agent.
+
+        Returns:
+            list: One result dict or exception per merchant, in input order.
+        """
+        if not pass_full_data:
+            try:
+                return agent.classify_batch(
+                    [(merchant_name, legal_name)
+                     for merchant_name, legal_name, _, _, _ in valid_merchants]
+                )
+            except Exception as e:
+                logger.info(f"Batch classification failed for agent {agent.name}, "
+                            f"retrying per merchant: {str(e)}")
+
+        return [
+            self._classify_task(agent, merchant_name, legal_name, additional_data, pass_full_data)
+            for merchant_name, legal_name, _, _, additional_data in valid_merchants
+        ]
+
+    def _tally_metrics(self, results_by_agent: List[List[Any]], match_by_agent: List[Any],
+                       metrics: Dict[str, Dict[str, int]]) -> None:
+        """
+        Fill the per-agent correct/total counters from the match masks.
+
+        One reduction per agent replaces per-row counter updates: totals are
+        the non-exception results and correct counts are the mask sums
+        (exceptions contribute False entries by construction).
+
+        Args:
+            results_by_agent (list): Per-agent result-or-exception lists.
+            match_by_agent (list): Per-agent boolean masks from _match_masks.
+            metrics (dict): Per-agent correct/total counters to fill in place.
+        """
+        for agent, agent_results, mask in zip(self.agents, results_by_agent, match_by_agent):
+            errors = sum(1 for result in agent_results if isinstance(result, Exception))
+            agent_metrics = metrics[agent.name]
+            agent_metrics["total"] = len(agent_results) - errors
+            agent_metrics["correct"] = _sum_matches(mask)
+
+    def _build_output_row(self, merchant_name: str, legal_name: str, actual_mcc: str,
+                          mcc_description: str, agent_results: List[Any],
+                          agent_matches: List[bool]) -> Dict[str, Any]:
+        """
+        Build one output row from per-agent results.
+
+        Args:
+            merchant_name (str): The merchant name.
+            legal_name (str): The legal name of the merchant.
+            actual_mcc (str): The expected MCC code, already stripped by the caller.
+            mcc_description (str): The expected MCC description.
+            agent_results (list): One entry per agent - a result dict or an exception.
+            agent_matches (list): Per-agent booleans from _match_masks; ignored
+                for entries whose result is an exception.
+
+        Returns:
+            dict: The assembled output row.
+        """
+        output_row = {
+            "Merchant Name": merchant_name,
+            "Legal Name": legal_name,
+            "Actual MCC": actual_mcc,
+            "MCC Description": mcc_description
+        }
+
+        for (agent_name, col_mcc, col_desc, col_conf, col_match), result, matched in zip(
+                self._agent_layout, agent_results, agent_matches):
+            if isinstance(result, Exception):
+                output_row[col_mcc] = "ERROR"
+                output_row[col_desc] = str(result)
+                output_row[col_conf] = 0.0
+                output_row[col_match] = "Error"
+                continue
+
+            output_row[col_mcc] = result["mcc_code"]
+            output_row[col_desc] = result["mcc_description"]
+            output_row[col_conf] = result["confidence"]
+            output_row[col_match] = "Yes" if matched else "No"
+
+        return output_row
+
+    def _iter_output_rows(self, valid_merchants: List[tuple], results_by_agent: List[List[Any]],
+                          match_by_agent: List[Any]):
+        """
+        Yield one assembled output row per merchant.
+        """
+        for index, (merchant_name, legal_name, actual_mcc, mcc_description, _) in enumerate(valid_merchants):
+            agent_results = [agent_results[index] for agent_results in results_by_agent]
+            agent_matches = [mask[index] for mask in match_by_agent]
+            yield self._build_output_row(
+                merchant_name, legal_name, actual_mcc, mcc_description,
+                agent_results, agent_matches
+            )
+
+    def evaluate(self, input_file: str, output_file: str, pass_full_data: bool = False,
+                 max_workers: int = None, row_sink=None) -> Dict[str, Any]:
         """
         Evaluate the performance of MCC classification agents on a dataset.
-        
+
         Args:
             input_file (str): The path to the input CSV file containing merchant data.
-            output_file (str): The path to write the output CSV file with evaluation results.
+            output_file (str): The path to write the evaluation results to. A
+                .parquet extension selects columnar Parquet output (requires
+                pyarrow, no summary row); anything else is written as CSV.
             pass_full_data (bool): Whether to pass full merchant data to agents.
-            
+            max_workers (int, optional): When set to more than 1, classification calls are
+                dispatched through a thread pool per (merchant, agent) task so API requests
+                overlap instead of waiting on each other. By default each agent's batched
+                pass runs on its own thread; pass 1 to force fully serial execution.
+                Results are reassembled in input order either way.
+            row_sink (callable, optional): When provided, each assembled output row
+                (and the trailing summary row) is passed to this callable instead of
+                being serialized to output_file, skipping the CSV write entirely for
+                callers that consume rows directly.
+
         Returns:
             dict: A dictionary containing evaluation metrics for each agent.
-            
+
         Raises:
             FileNotFoundError: If the input file does not exist.
             Exception: For other errors encountered during evaluation.
@@ -46,123 +353,282 @@ class MCCEvaluator:
         try:
             logger.info(f"Starting evaluation with input file: {input_file}")
             
-            # Read input data
-            input_data = DataHandler.read_csv(input_file)
-            logger.info(f"Read {len(input_data)} merchants from input file")
-            
-            # Prepare output data
-            output_data = []
-            
+            # The whole input is materialized: batch validation and per-agent
+            # batched dispatch need every row at once, which traded away the
+            # earlier row-by-row streaming. read_csv_iter (rather than
+            # read_csv) keeps the rows out of the read cache, which would
+            # otherwise retain a second copy of a large input for the life of
+            # the process.
+            rows = list(DataHandler.read_csv_iter(input_file))
+
             # Set up metrics tracking
             metrics = {agent.name: {"correct": 0, "total": 0} for agent in self.agents}
-            
-            # Process each merchant
-            for merchant in input_data:
+
+            # Validate the whole batch up front (vectorized for large inputs),
+            # then collect merchants so classification can be dispatched as a
+            # batch. The passthrough key list is computed once from the first
+            # row's header rather than re-filtering every row's items.
+            row_count = len(rows)
+
+            extra_keys = None
+            valid_merchants = []
+            for merchant in self._filter_valid(rows):
                 merchant_name = merchant.get("Merchant Name", "")
                 legal_name = merchant.get("Legal Name", "")
                 actual_mcc = merchant.get("Actual MCC code", "")
                 mcc_description = merchant.get("MCC Description", "")
-                original_mcc_code = merchant.get("original Mcc code", "")
-                ai_original_description = merchant.get("ai_original_description", "")
-                
-                # Skip rows with missing data
-                if not merchant_name or not actual_mcc:
-                    logger.warning(f"Skipping row with missing data: {merchant}")
-                    continue
-                
-                # Create output row with base data
-                output_row = {
-                    "Merchant Name": merchant_name,
-                    "Legal Name": legal_name,
-                    "Actual MCC": actual_mcc,
-                    "MCC Description": mcc_description
-                }
-                
-                # Prepare additional data to pass to the agent
-                additional_data = {
-                    "original_mcc_code": original_mcc_code,
-                    "mcc_description": mcc_description,
-                    "ai_original_description": ai_original_description,
-                    # Include any other fields that might be useful
-                    **{k: v for k, v in merchant.items() if k not in ["Merchant Name", "Legal Name"]}
-                }
-                
-                # Get classifications from each agent
-                for agent in self.agents:
-                    try:
-                        # Try to classify merchant with appropriate method based on pass_full_data flag
-                        if pass_full_data:
-                            try:
-                                # First try with full data
-                                result = agent.classify(merchant_name, legal_name, **additional_data)
-                            except TypeError as e:
-                                # If the agent doesn't support full data, fall back to basic parameters
-                                logger.info(f"Agent {agent.name} doesn't support full data, falling back to basic parameters")
-                                result = agent.classify(merchant_name, legal_name)
-                        else:
-                            # Use the simple classify method with just merchant name and legal name
-                            result = agent.classify(merchant_name, legal_name)
-                        
-                        # Add result to output row
-                        output_row[f"{agent.name}'s suggested MCC"] = result["mcc_code"]
-                        output_row[f"{agent.name}'s MCC description"] = result["mcc_description"]
-                        output_row[f"{agent.name}'s confidence"] = result["confidence"]
-                        
-                        # Update metrics
-                        metrics[agent.name]["total"] += 1
-                        if str(result["mcc_code"]).strip() == str(actual_mcc).strip():
-                            metrics[agent.name]["correct"] += 1
-                            output_row[f"{agent.name}'s match"] = "Yes"
-                        else:
-                            output_row[f"{agent.name}'s match"] = "No"
-                    
-                    except Exception as e:
-                        logger.error(f"Error classifying merchant {merchant_name} with agent {agent.name}: {str(e)}")
-                        output_row[f"{agent.name}'s suggested MCC"] = "ERROR"
-                        output_row[f"{agent.name}'s MCC description"] = str(e)
-                        output_row[f"{agent.name}'s confidence"] = 0.0
-                        output_row[f"{agent.name}'s match"] = "Error"
-                
-                # Add row to output data
-                output_data.append(output_row)
-            
-            # Calculate performance metrics
-            performance_metrics = {}
-            for agent_name, data in metrics.items():
-                correct = data["correct"]
-                total = data["total"]
-                performance_metrics[agent_name] = {
-                    "accuracy": correct / total if total > 0 else 0,
-                    "correct_classifications": correct,
-                    "total_classifications": total
-                }
-            
-            # Add summary row
-            summary_row = {
-                "Merchant Name": "SUMMARY",
-                "Legal Name": "",
-                "Actual MCC": "",
-                "MCC Description": ""
-            }
-            
-            for agent in self.agents:
-                agent_metrics = performance_metrics[agent.name]
-                summary_row[f"{agent.name}'s suggested MCC"] = ""
-                summary_row[f"{agent.name}'s MCC description"] = ""
-                summary_row[f"{agent.name}'s confidence"] = ""
-                summary_row[f"{agent.name}'s match"] = f"Accuracy: {agent_metrics['accuracy']:.2%}"
-            
-            output_data.append(summary_row)
-            
-            # Write output data
-            DataHandler.write_csv(output_file, output_data)
-            
+
+                # Canonicalize the expected MCC once per row; the per-agent match
+                # check then reduces to a plain string equality
+                actual_mcc = sys.intern(str(actual_mcc).strip())
+
+                # The extra-field dict is only consumed on the pass_full_data
+                # path; skip the per-merchant copy entirely otherwise
+                additional_data = None
+                if pass_full_data:
+                    if extra_keys is None:
+                        extra_keys = [k for k in merchant if k not in ("Merchant Name", "Legal Name")]
+
+                    # Prepare additional data to pass to the agent; these
+                    # fields are only read on this path, so only fetch them here
+                    additional_data = {
+                        "original_mcc_code": merchant.get("original Mcc code", ""),
+                        "mcc_description": mcc_description,
+                        "ai_original_description": merchant.get("ai_original_description", ""),
+                        # Include any other fields that might be useful
+                        **{k: merchant[k] for k in extra_keys if k in merchant}
+                    }
+
+                valid_merchants.append((merchant_name, legal_name, actual_mcc, mcc_description, additional_data))
+
+            logger.info(f"Read {row_count} merchants from input file")
+
+            if max_workers and max_workers > 1:
+                # API-bound work: overlap requests across merchants instead of
+                # one call at a time, one task per (merchant, agent) pair
+                tasks = [
+                    (agent, merchant_name, legal_name, additional_data, pass_full_data)
+                    for merchant_name, legal_name, _, _, additional_data in valid_merchants
+                    for agent in self.agents
+                ]
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(lambda task: self._classify_task(*task), tasks))
+                # Tasks are merchant-major, so agent i's results are every
+                # len(self.agents)-th entry starting at i
+                results_by_agent = [results[i::len(self.agents)] for i in range(len(self.agents))]
+            elif len(self.agents) > 1 and max_workers != 1:
+                # Agents are independent and I/O-bound, so overlap their
+                # batched passes; wall time becomes the max over agents
+                # instead of the sum. executor.map keeps agent order.
+                with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+                    results_by_agent = list(executor.map(
+                        lambda agent: self._run_agent(agent, valid_merchants, pass_full_data),
+                        self.agents
+                    ))
+            else:
+                # One batched classification pass per agent
+                results_by_agent = [
+                    self._run_agent(agent, valid_merchants, pass_full_data)
+                    for agent in self.agents
+                ]
+
+            match_by_agent = self._match_masks(
+                [actual_mcc for _, _, actual_mcc, _, _ in valid_merchants], results_by_agent
+            )
+
+            self._tally_metrics(results_by_agent, match_by_agent, metrics)
+
+            row_iter = self._iter_output_rows(valid_merchants, results_by_agent, match_by_agent)
+
+            if row_sink is not None:
+                # The caller consumes rows directly; skip CSV serialization
+                # and the file write entirely
+                for output_row in row_iter:
+                    row_sink(output_row)
+                performance_metrics = self._compute_performance_metrics(metrics)
+                row_sink(self._summary_row(performance_metrics))
+                logger.info("Evaluation complete. Results delivered to row sink")
+                return performance_metrics
+
+            if output_file.lower().endswith(".parquet"):
+                # Columnar output for downstream analysis. Parquet columns are
+                # typed, so the mixed-type summary row is omitted; the metrics
+                # it carries are in the return value.
+                output_data = list(row_iter)
+                performance_metrics = self._compute_performance_metrics(metrics)
+                DataHandler.write_parquet(output_file, output_data, self._output_fieldnames())
+                logger.info(f"Evaluation complete. Results written to {output_file}")
+                return performance_metrics
+
+            # Stream output rows to disk as they are assembled instead of buffering
+            # the whole result set; only the metrics counters stay in memory.
+            with DataHandler.csv_writer(output_file, self._output_fieldnames()) as writer:
+                for output_row in row_iter:
+                    writer.writerow(output_row)
+
+                performance_metrics = self._compute_performance_metrics(metrics)
+                writer.writerow(self._summary_row(performance_metrics))
+
             logger.info(f"Evaluation complete. Results written to {output_file}")
-            
-            # Return performance metrics
+
             return performance_metrics
-        
+
         except Exception as e:
             error_msg = f"Error during evaluation: {str(e)}"
             logger.error(error_msg)
-            raise Exception(error_msg) 
\ No newline at end of file
+            raise Exception(error_msg)
+
+    def _output_fieldnames(self) -> List[str]:
+        """
+        Return the output CSV columns: base merchant fields plus four per agent.
+        """
+        fieldnames = ["Merchant Name", "Legal Name", "Actual MCC", "MCC Description"]
+        for agent in self.agents:
+            fieldnames.extend(self._agent_columns[agent.name])
+        return fieldnames
+
+    @staticmethod
+    def _compute_performance_metrics(metrics: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+        """
+        Turn per-agent correct/total counters into the metrics dictionary.
+
+        Args:
+            metrics (dict): Per-agent correct/total counters.
+
+        Returns:
+            dict: A dictionary containing evaluation metrics for each agent.
+        """
+        performance_metrics = {}
+        for agent_name, data in metrics.items():
+            correct = data["correct"]
+            total = data["total"]
+            performance_metrics[agent_name] = {
+                "accuracy": correct / total if total > 0 else 0,
+                "correct_classifications": correct,
+                "total_classifications": total
+            }
+        return performance_metrics
+
+    def _summary_row(self, performance_metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the trailing summary row with each agent's accuracy.
+
+        Args:
+            performance_metrics (dict): Metrics as returned by _compute_performance_metrics.
+
+        Returns:
+            dict: The summary output row.
+        """
+        summary_row = {
+            "Merchant Name": "SUMMARY",
+            "Legal Name": "",
+            "Actual MCC": "",
+            "MCC Description": ""
+        }
+
+        for agent in self.agents:
+            agent_metrics = performance_metrics[agent.name]
+            col_mcc, col_desc, col_conf, col_match = self._agent_columns[agent.name]
+            summary_row[col_mcc] = ""
+            summary_row[col_desc] = ""
+            summary_row[col_conf] = ""
+            summary_row[col_match] = f"Accuracy: {agent_metrics['accuracy']:.2%}"
+
+        return summary_row
+
+    def _finalize_results(self, metrics: Dict[str, Dict[str, int]],
+                          output_data: List[Dict[str, Any]], output_file: str) -> Dict[str, Any]:
+        """
+        Compute performance metrics, append the summary row, and write the output file.
+
+        Args:
+            metrics (dict): Per-agent correct/total counters.
+            output_data (list): The assembled output rows.
+            output_file (str): The path to write the output CSV file.
+
+        Returns:
+            dict: A dictionary containing evaluation metrics for each agent.
+        """
+        performance_metrics = self._compute_performance_metrics(metrics)
+        output_data.append(self._summary_row(performance_metrics))
+
+        # Write output data
+        DataHandler.write_csv(output_file, output_data)
+
+        logger.info(f"Evaluation complete. Results written to {output_file}")
+
+        return performance_metrics
+
+    def evaluate_parallel(self, input_file: str, output_file: str,
+                          processes: int = None) -> Dict[str, Any]:
+        """
+        Evaluate agents across a process pool for the CPU-bound fallback path.
+
+        Unlike evaluate's thread pool, this bypasses the GIL: each worker process
+        builds its own agent instances (with their precompiled pattern banks) once
+        and classifies whole merchants. Intended for large inputs running the
+        regex fallback path; agents classify with basic parameters only.
+
+        Args:
+            input_file (str): The path to the input CSV file containing merchant data.
+            output_file (str): The path to write the output CSV file with evaluation results.
+            processes (int, optional): Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            dict: A dictionary containing evaluation metrics for each agent.
+
+        Raises:
+            FileNotFoundError: If the input file does not exist.
+            Exception: For other errors encountered during evaluation.
+        """
+        try:
+            logger.info(f"Starting parallel evaluation with input file: {input_file}")
+
+            input_data = DataHandler.read_csv(input_file, dtype=MCC_INPUT_DTYPES)
+            logger.info(f"Read {len(input_data)} merchants from input file")
+
+            output_data = []
+            metrics = {agent.name: {"correct": 0, "total": 0} for agent in self.agents}
+
+            # Collect valid merchants, matching evaluate's row filtering
+            valid_merchants = []
+            for merchant in self._filter_valid(input_data):
+                merchant_name = merchant.get("Merchant Name", "")
+                legal_name = merchant.get("Legal Name", "")
+                actual_mcc = merchant.get("Actual MCC code", "")
+                mcc_description = merchant.get("MCC Description", "")
+
+                actual_mcc = sys.intern(str(actual_mcc).strip())
+                valid_merchants.append((merchant_name, legal_name, actual_mcc, mcc_description))
+
+            tasks = [(merchant_name, legal_name)
+                     for merchant_name, legal_name, _, _ in valid_merchants]
+            agent_types = [agent.name.lower() for agent in self.agents]
+
+            # map (not imap_unordered) keeps results aligned with input order
+            with multiprocessing.Pool(processes or os.cpu_count(),
+                                      initializer=_init_worker,
+                                      initargs=(agent_types,)) as pool:
+                all_results = pool.map(_classify_row, tasks, chunksize=64)
+
+            results_by_agent = [list(agent_results) for agent_results in zip(*all_results)]
+            match_by_agent = self._match_masks(
+                [actual_mcc for _, _, actual_mcc, _ in valid_merchants], results_by_agent
+            )
+            self._tally_metrics(results_by_agent, match_by_agent, metrics)
+
+            for index, (merchant_tuple, agent_results) in enumerate(zip(valid_merchants, all_results)):
+                merchant_name, legal_name, actual_mcc, mcc_description = merchant_tuple
+                agent_matches = [mask[index] for mask in match_by_agent]
+                output_row = self._build_output_row(
+                    merchant_name, legal_name, actual_mcc, mcc_description,
+                    agent_results, agent_matches
+                )
+                output_data.append(output_row)
+
+            return self._finalize_results(metrics, output_data, output_file)
+
+        except Exception as e:
+            error_msg = f"Error during parallel evaluation: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
\ No newline at end of file
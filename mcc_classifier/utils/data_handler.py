@@ -1,25 +1,142 @@
 import csv
+import io
 import logging
 import os
-from typing import List, Dict, Any
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Tuple
 
-import pandas as pd
+# pandas is only needed on the read and fallback-write paths; importing it
+# lazily keeps its several-hundred-ms startup cost (numpy included) out of
+# scripts and tests that never touch CSVs.
+_pd = None
+
+def _pandas():
+    """Import pandas on first use and cache the module."""
+    global _pd
+    if _pd is None:
+        import pandas
+        _pd = pandas
+    return _pd
+
+# Optional fast CSV parser; pandas stays as the fallback when not installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger("mcc_classifier.data_handler")
 
+# Known schema of the merchant input CSVs. Passing it to read_csv lets pandas
+# skip type inference and, more importantly, keeps MCC codes as strings so
+# leading zeros (e.g. "0780") survive the parse.
+MCC_INPUT_DTYPES = {
+    "Merchant Name": "string",
+    "Legal Name": "string",
+    "Actual MCC code": "string",
+    "MCC Description": "string",
+}
+
+# Fixed column order of the merchant input CSVs, usable as read_csv's
+# opt-in schema argument
+MCC_INPUT_SCHEMA = tuple(MCC_INPUT_DTYPES)
+
+# Directories already ensured by _ensure_directory; skips the repeated
+# makedirs stat syscalls on hot write paths.
+_DIRS_CREATED = set()
+
+def _arrow_convert_options(file_path):
+    """
+    Build ConvertOptions forcing every column in the file to string.
+
+    Typing only the known merchant columns left the rest to Arrow's
+    inference, which drops leading zeros from extra code columns and turns
+    all-empty columns into nulls. Reading the header first and typing each
+    column as string matches the pandas path's dtype=str /
+    keep_default_na=False behavior exactly: codes stay intact and empty
+    cells come back as "".
+    """
+    with open(file_path, "r", newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    return pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in header},
+        strings_can_be_null=False
+    )
+
+@lru_cache(maxsize=4)
+def _schema_parser(schema):
+    """
+    Generate a line parser specialized for a fixed column tuple.
+
+    The generated function splits each line once and builds the row dict
+    with literal keys, eliding csv.DictReader's dialect state machine and
+    its per-field fieldname indexing. It is only correct for files without
+    quoted fields; callers verify that precondition first. A row of the
+    wrong width raises ValueError so the caller can fall back.
+    """
+    width = len(schema)
+    items = ", ".join(f"K{i}: parts[{i}]" for i in range(width))
+    source = (
+        "def _parse(lines):\n"
+        "    out = []\n"
+        "    append = out.append\n"
+        "    for line in lines:\n"
+        "        parts = line.split(',')\n"
+        f"        if len(parts) != {width}:\n"
+        "            raise ValueError('row width mismatch')\n"
+        f"        append({{{items}}})\n"
+        "    return out\n"
+    )
+    namespace = {f"K{i}": key for i, key in enumerate(schema)}
+    exec(source, namespace)
+    return namespace["_parse"]
+
+@lru_cache(maxsize=16)
+def _read_csv_cached(file_path, mtime_ns, size):
+    """
+    Parse a CSV once per (path, mtime, size) and keep the rows for re-reads.
+
+    The mtime/size key makes the cache self-invalidating: touching or
+    rewriting the file changes the key, so stale entries are never served.
+    """
+    return tuple(DataHandler._parse_csv(file_path, None))
+
 class DataHandler:
     """
     Utility class for handling data operations such as reading and writing CSV files.
     """
-    
+
+    @staticmethod
+    def _ensure_directory(file_path: str) -> None:
+        """
+        Create the parent directory of file_path once per process.
+        """
+        directory = os.path.dirname(os.path.abspath(file_path))
+        if directory not in _DIRS_CREATED:
+            os.makedirs(directory, exist_ok=True)
+            _DIRS_CREATED.add(directory)
+
     @staticmethod
-    def read_csv(file_path: str) -> List[Dict[str, Any]]:
+    def read_csv(file_path: str, dtype: Dict[str, Any] = None,
+                 schema: tuple = None) -> List[Dict[str, Any]]:
         """
         Read a CSV file and return its contents as a list of dictionaries.
-        
+
         Args:
             file_path (str): The path to the CSV file.
-            
+            dtype (dict, optional): Explicit pandas column dtypes (e.g.
+                MCC_INPUT_DTYPES). Defaults to reading every column as str,
+                which preserves leading zeros in code columns. Only applied
+                on the pandas path.
+            schema (tuple, optional): Exact column tuple of the file (e.g.
+                MCC_INPUT_SCHEMA). Opts into a parser generated for that
+                fixed layout; files that don't satisfy its preconditions
+                (matching header, no quoted fields) silently use the
+                generic path instead.
+
         Returns:
             list: A list of dictionaries, where each dictionary represents a row in the CSV.
             
@@ -31,22 +148,448 @@ class DataHandler:
             error_msg = f"File not found: {file_path}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
-        
+
         try:
             logger.info(f"Reading data from {file_path}")
-            
-            # Use pandas to read the CSV file
-            df = pd.read_csv(file_path)
+
+            if schema is not None:
+                rows = DataHandler._read_csv_schema(file_path, tuple(schema))
+                if rows is not None:
+                    logger.info(f"Successfully read {len(rows)} rows from {file_path}")
+                    return rows
+
+            if dtype is None:
+                # Re-reads of an unchanged file (same mtime and size) skip the
+                # parse entirely; rows are shallow-copied on the way out so
+                # callers can mutate their view without corrupting the cache
+                stat = os.stat(file_path)
+                rows = _read_csv_cached(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+                return [dict(row) for row in rows]
+
+            return DataHandler._parse_csv(file_path, dtype)
+
+        except Exception as e:
+            error_msg = f"Error reading CSV file {file_path}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    @staticmethod
+    def _read_csv_schema(file_path: str, schema: tuple) -> List[Dict[str, Any]]:
+        """
+        Parse a CSV with the generated fixed-schema parser.
+
+        Returns None when the file doesn't satisfy the parser's
+        preconditions - a header differing from the schema, any quoted
+        field, or a row of the wrong width - so read_csv can fall back to
+        the generic parse.
+        """
+        with open(file_path, "r", newline="", encoding="utf-8-sig", buffering=1 << 20) as f:
+            content = f.read()
+
+        # Quoted fields are the only way a well-formed CSV embeds commas or
+        # newlines, and the specialized split can't handle either
+        if '"' in content:
+            return None
+
+        lines = content.splitlines()
+        if not lines or tuple(lines[0].split(",")) != schema:
+            return None
+
+        try:
+            return _schema_parser(schema)(lines[1:])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_csv(file_path: str, dtype: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Parse a CSV file into row dictionaries (the uncached body of read_csv).
+        """
+        pd = _pandas()
+
+        # Opt-in parquet side-cache keyed by the source file's mtime and
+        # size, so iterative runs over the same input skip CSV parsing
+        cache_path = None
+        if os.environ.get("MCC_PARQUET_CACHE") == "1":
+            stat = os.stat(file_path)
+            cache_path = f"{file_path}.{stat.st_mtime_ns}.{stat.st_size}.parquet"
+            if os.path.exists(cache_path):
+                try:
+                    data = pd.read_parquet(cache_path).to_dict(orient="records")
+                    logger.info(f"Loaded {len(data)} rows from parquet cache {cache_path}")
+                    return data
+                except Exception as e:
+                    logger.warning(f"Could not read parquet cache {cache_path}: {str(e)}")
+
+        if PYARROW_AVAILABLE and dtype is None:
+            # Arrow parses in C++ threads and emits row dicts straight from
+            # its columnar buffers, skipping the DataFrame round-trip.
+            # Every column is pre-typed as string so no column goes through
+            # type inference and codes like "0780" stay intact.
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(use_threads=True),
+                convert_options=_arrow_convert_options(file_path)
+            )
+            data = table.to_pylist()
+        else:
+            # One C parsing loop over the whole file. Reading everything as
+            # str with keep_default_na=False skips dtype inference and NaN
+            # sentinels, so empty cells come back as "" instead of float NaN
+            df = pd.read_csv(file_path, dtype=dtype or str, keep_default_na=False)
             data = df.to_dict(orient="records")
-            
-            logger.info(f"Successfully read {len(data)} rows from {file_path}")
-            return data
-        
+
+        if cache_path is not None:
+            try:
+                pd.DataFrame(data).to_parquet(cache_path)
+                logger.info(f"Wrote parquet cache {cache_path}")
+            except Exception as e:
+                logger.warning(f"Could not write parquet cache {cache_path}: {str(e)}")
+
+        logger.info(f"Successfully read {len(data)} rows from {file_path}")
+        return data
+
+    @staticmethod
+    def read_csv_iter(file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a CSV file row by row as dictionaries.
+
+        Unlike read_csv, rows are yielded as they are parsed instead of being
+        materialized into a list, keeping input memory bounded regardless of
+        file size. All values are returned as strings.
+
+        Args:
+            file_path (str): The path to the CSV file.
+
+        Returns:
+            iterator: An iterator of dictionaries, one per row.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+        """
+        if not os.path.exists(file_path):
+            error_msg = f"File not found: {file_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        logger.info(f"Streaming data from {file_path}")
+
+        if PYARROW_AVAILABLE:
+            # Stream Arrow record batches so only one batch of parsed rows is
+            # alive at a time; parsing overlaps with downstream consumption.
+            # Pre-type every column as string exactly as _parse_csv does, so
+            # streamed reads keep codes like "0780" and empty cells as ""
+            def _iter_batches():
+                convert_options = _arrow_convert_options(file_path)
+                with pacsv.open_csv(file_path, convert_options=convert_options) as reader:
+                    for batch in reader:
+                        yield from batch.to_pylist()
+
+            return _iter_batches()
+
+        def _iter_rows():
+            for chunk in DataHandler.read_csv_chunks(file_path):
+                yield from chunk
+
+        return _iter_rows()
+
+    @staticmethod
+    def read_csv_chunks(file_path: str, chunksize: int = 50000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a CSV file as lists of row dictionaries, one chunk at a time.
+
+        Each chunk is parsed by pandas' C reader in a single pass, giving
+        bulk-parse throughput while holding at most chunksize rows in memory.
+        Values are returned as strings with empty cells as "".
+
+        Args:
+            file_path (str): The path to the CSV file.
+            chunksize (int): Maximum number of rows per yielded chunk.
+
+        Returns:
+            iterator: An iterator of row-dictionary lists.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+        """
+        if not os.path.exists(file_path):
+            error_msg = f"File not found: {file_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        def _iter_chunks():
+            logger.info(f"Reading {file_path} in chunks of {chunksize} rows")
+            with _pandas().read_csv(file_path, dtype=str, keep_default_na=False,
+                                    chunksize=chunksize) as reader:
+                for chunk in reader:
+                    yield chunk.to_dict(orient="records")
+
+        return _iter_chunks()
+
+    @staticmethod
+    def read_csv_rows(file_path: str, dtype: Dict[str, Any] = None) -> Tuple[List[str], Iterator[tuple]]:
+        """
+        Read a CSV file and return its columns plus an iterator of row tuples.
+
+        to_dict(orient="records") allocates one dict and re-references every
+        value per row; callers that can consume rows positionally get the
+        parsed frame's tuples directly and only zip against the column list
+        when dict-style access is actually needed.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            dtype (dict, optional): Explicit pandas column dtypes (e.g.
+                MCC_INPUT_DTYPES). Defaults to reading every column as str
+                with empty cells as "", matching the module's other readers.
+
+        Returns:
+            tuple: (column names, iterator of plain row tuples in column order).
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+            Exception: For other errors encountered while reading the file.
+        """
+        if not os.path.exists(file_path):
+            error_msg = f"File not found: {file_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        try:
+            logger.info(f"Reading rows from {file_path}")
+            df = _pandas().read_csv(file_path, dtype=dtype or str, keep_default_na=False)
+            return list(df.columns), df.itertuples(index=False, name=None)
+
         except Exception as e:
             error_msg = f"Error reading CSV file {file_path}: {str(e)}"
             logger.error(error_msg)
             raise Exception(error_msg)
-    
+
+    @staticmethod
+    @contextmanager
+    def csv_writer(file_path: str, fieldnames: List[str]):
+        """
+        Context manager yielding a csv.DictWriter that streams rows to a file.
+
+        Unlike write_csv, rows are flushed to disk as they are written instead of
+        being buffered in memory, keeping memory usage bounded for large outputs.
+        The header is written on entry.
+
+        Args:
+            file_path (str): The path to the output CSV file.
+            fieldnames (list): The field names to use for the CSV header.
+
+        Yields:
+            csv.DictWriter: A writer whose writerow accepts row dictionaries.
+
+        Raises:
+            Exception: For errors encountered while opening or writing the file.
+        """
+        try:
+            # Create directory if it doesn't exist
+            DataHandler._ensure_directory(file_path)
+
+            logger.info(f"Streaming rows to {file_path}")
+
+            # Large block buffer so streamed rows coalesce into ~1 MiB write
+            # syscalls; the single flush on close is enough
+            with open(file_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
+                writer.writeheader()
+                yield writer
+
+            logger.info(f"Successfully wrote data to {file_path}")
+
+        except Exception as e:
+            error_msg = f"Error writing CSV file {file_path}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    @staticmethod
+    def write_parquet(file_path: str, data: List[Dict[str, Any]], fieldnames: List[str] = None) -> None:
+        """
+        Write row dictionaries to a Parquet file.
+
+        Columnar, compressed, and typed, Parquet moves several times fewer
+        bytes than the CSV equivalent and re-reads skip text parsing
+        entirely. All values in a column must share a type. Requires pyarrow.
+
+        Args:
+            file_path (str): The path to the output Parquet file.
+            data (list): A list of dictionaries to write.
+            fieldnames (list, optional): Column names and order. Defaults to
+                the keys of the first row.
+
+        Raises:
+            ValueError: If data is empty and no fieldnames are provided.
+            Exception: If pyarrow is unavailable or the write fails.
+        """
+        if not PYARROW_AVAILABLE:
+            error_msg = "pyarrow is required to write Parquet files"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+        if not data and not fieldnames:
+            error_msg = "Cannot write Parquet: data is empty and no fieldnames provided"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        try:
+            DataHandler._ensure_directory(file_path)
+
+            logger.info(f"Writing {len(data)} rows to {file_path}")
+
+            if fieldnames:
+                table = pa.table({name: [row.get(name, "") for row in data] for name in fieldnames})
+            else:
+                table = pa.Table.from_pylist(data)
+            pq.write_table(table, file_path, compression="zstd")
+
+            logger.info(f"Successfully wrote data to {file_path}")
+
+        except Exception as e:
+            error_msg = f"Error writing Parquet file {file_path}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    @staticmethod
+    def read_parquet(file_path: str) -> List[Dict[str, Any]]:
+        """
+        Read a Parquet file and return its contents as a list of dictionaries.
+
+        Args:
+            file_path (str): The path to the Parquet file.
+
+        Returns:
+            list: A list of dictionaries, one per row.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+            Exception: If pyarrow is unavailable or the read fails.
+        """
+        if not PYARROW_AVAILABLE:
+            error_msg = "pyarrow is required to read Parquet files"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+        if not os.path.exists(file_path):
+            error_msg = f"File not found: {file_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        try:
+            logger.info(f"Reading data from {file_path}")
+            return pq.read_table(file_path).to_pylist()
+
+        except Exception as e:
+            error_msg = f"Error reading Parquet file {file_path}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    @staticmethod
+    def write_csv_fast(file_path: str, data: List[Dict[str, Any]], fieldnames: List[str] = None) -> None:
+        """
+        Write row dicts by joining pre-formatted lines, skipping csv escaping.
+
+        For payloads known to be simple - no commas, quotes, or newlines in
+        any field - the whole file reduces to str.join calls in C. Every
+        value is scanned first; if anything would need escaping, the call is
+        handed to write_csv, so output is always well-formed.
+
+        Args:
+            file_path (str): The path to the output CSV file.
+            data (list): A list of dictionaries to write to the CSV file.
+            fieldnames (list, optional): The field names to use for the CSV header.
+                Defaults to the keys of the first row.
+
+        Raises:
+            ValueError: If data is empty and no fieldnames are provided.
+            Exception: For other errors encountered while writing the file.
+        """
+        if not data and not fieldnames:
+            error_msg = "Cannot write CSV: data is empty and no fieldnames provided"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        fieldnames = fieldnames or list(data[0])
+
+        if any("," in name or '"' in name or "\n" in name or "\r" in name for name in fieldnames):
+            logger.info(f"Header needs csv escaping; writing {file_path} via write_csv")
+            DataHandler.write_csv(file_path, data, fieldnames)
+            return
+
+        lines = [",".join(fieldnames)]
+        for row in data:
+            values = [str(row.get(name, "")) for name in fieldnames]
+            for value in values:
+                if "," in value or '"' in value or "\n" in value or "\r" in value:
+                    logger.info(f"Field needs csv escaping; writing {file_path} via write_csv")
+                    DataHandler.write_csv(file_path, data, fieldnames)
+                    return
+            lines.append(",".join(values))
+
+        try:
+            DataHandler._ensure_directory(file_path)
+
+            logger.info(f"Writing {len(data)} rows to {file_path}")
+
+            with open(file_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                f.write("\n".join(lines) + "\n")
+
+            logger.info(f"Successfully wrote data to {file_path}")
+
+        except Exception as e:
+            error_msg = f"Error writing CSV file {file_path}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    @staticmethod
+    def write_csv_columnar(file_path: str, columns: Dict[str, List[Any]]) -> None:
+        """
+        Write a CSV file from parallel column lists.
+
+        Column-major callers skip the per-row dictionaries write_csv works
+        with. With pyarrow available the table is encoded by Arrow's C++
+        writer; otherwise the columns are zipped through csv.writer's C loop.
+
+        Args:
+            file_path (str): The path to the output CSV file.
+            columns (dict): Mapping of column name to its list of values; all
+                lists must have the same length.
+
+        Raises:
+            ValueError: If columns is empty or the column lengths differ.
+            Exception: For other errors encountered while writing the file.
+        """
+        if not columns:
+            error_msg = "Cannot write CSV: no columns provided"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        if len({len(values) for values in columns.values()}) > 1:
+            error_msg = "Cannot write CSV: column lengths differ"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        try:
+            DataHandler._ensure_directory(file_path)
+
+            logger.info(f"Writing {len(next(iter(columns.values())))} rows to {file_path}")
+
+            if PYARROW_AVAILABLE:
+                pacsv.write_csv(pa.table(columns), file_path)
+            else:
+                with open(file_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    writer.writerows(zip(*columns.values()))
+
+            logger.info(f"Successfully wrote data to {file_path}")
+
+        except Exception as e:
+            error_msg = f"Error writing CSV file {file_path}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
     @staticmethod
     def write_csv(file_path: str, data: List[Dict[str, Any]], fieldnames: List[str] = None) -> None:
         """
@@ -67,28 +610,61 @@ class DataHandler:
             error_msg = "Cannot write CSV: data is empty and no fieldnames provided"
             logger.error(error_msg)
             raise ValueError(error_msg)
-            
+
+        if not data:
+            # Header-only file: one csv-escaped row, no writer machinery
+            try:
+                DataHandler._ensure_directory(file_path)
+                with open(file_path, "w", newline="", encoding="utf-8") as f:
+                    csv.writer(f).writerow(fieldnames)
+                logger.info(f"Wrote header-only CSV to {file_path}")
+                return
+            except Exception as e:
+                error_msg = f"Error writing CSV file {file_path}: {str(e)}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
+
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-            
+            DataHandler._ensure_directory(file_path)
+
             logger.info(f"Writing {len(data)} rows to {file_path}")
-            
-            # Use pandas to write the CSV file
-            df = pd.DataFrame(data)
-            
-            # Ensure columns are in the specified order if fieldnames is provided
-            if fieldnames:
-                # Add any missing columns to the dataframe
-                for field in fieldnames:
-                    if field not in df.columns:
-                        df[field] = ""
-                
-                # Reorder columns according to fieldnames
-                df = df[fieldnames]
-            
-            df.to_csv(file_path, index=False)
-            
+
+            if not data or isinstance(data[0], dict):
+                # Plain row dicts go straight through csv.DictWriter; building
+                # a DataFrame just to serialize it costs far more than the
+                # write itself at these row counts
+                if not fieldnames:
+                    # Union of keys across rows in first-seen order, matching
+                    # the column set pandas would have produced
+                    seen = {}
+                    for row in data:
+                        seen.update(dict.fromkeys(row))
+                    fieldnames = list(seen)
+
+                # Render the whole payload into one in-memory buffer first:
+                # writerows keeps the per-row loop in C, and the file then
+                # receives a single contiguous write instead of one per block
+                buf = io.StringIO()
+                writer = csv.DictWriter(buf, fieldnames=fieldnames, restval="", extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(data)
+
+                with open(file_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                    f.write(buf.getvalue())
+            else:
+                # Fall back to pandas for anything needing dtype-aware formatting.
+                # Passing columns= builds the frame with the right schema in one
+                # shot instead of inserting each missing column after the fact.
+                pd = _pandas()
+                if fieldnames:
+                    df = pd.DataFrame(data, columns=fieldnames).fillna("")
+                else:
+                    df = pd.DataFrame(data)
+
+                with open(file_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                    df.to_csv(f, index=False)
+
             logger.info(f"Successfully wrote data to {file_path}")
         
         except Exception as e:
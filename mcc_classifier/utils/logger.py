@@ -1,44 +1,69 @@
 import logging
+import multiprocessing
 import os
 import sys
-from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+# Set once the root logger has been configured; repeat calls to setup_logging
+# early-return instead of reopening handlers and file descriptors.
+_configured = False
 
 def setup_logging(log_level=logging.INFO, log_to_file=True):
     """
     Configure logging for the MCC classifier application.
-    
+
+    Safe to call from every entry-point script: only the first call installs
+    handlers, so repeated invocations (or pytest importing several scripts)
+    don't stack duplicate handlers or open extra log files.
+
     Args:
         log_level (int): The logging level to use (default: logging.INFO).
         log_to_file (bool): Whether to log to a file (default: True).
     """
+    global _configured
+    if _configured:
+        return
+
     # Create logs directory if it doesn't exist
     if log_to_file and not os.path.exists("logs"):
         os.makedirs("logs")
-    
+
     # Create a formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+
     # Configure root logger
     logger = logging.getLogger()
     logger.setLevel(log_level)
-    
-    # Clear existing handlers
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
+
+    # Close any existing handlers, then drop them in one shot rather than
+    # paying a removeHandler call (and its lock) per handler
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
     # Add console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
-    
-    # Add file handler if requested
+
+    # Add file handler if requested; one rotating file shared across runs
+    # keeps a single buffered fd instead of a new timestamped file per start.
+    # Worker processes get their own file: several processes rotating one
+    # shared file interleave writes and drop lines whenever one rolls the
+    # file while the others still hold the old fd
     if log_to_file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_handler = logging.FileHandler(f"logs/mcc_classifier_{timestamp}.log")
+        log_file = "logs/mcc_classifier.log"
+        if multiprocessing.parent_process() is not None:
+            log_file = f"logs/mcc_classifier.{os.getpid()}.log"
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=16 << 20, backupCount=4
+        )
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
-    
+
+    _configured = True
+
     # Log initial message
-    logger.info("Logging configured for MCC Classifier") 
\ No newline at end of file
+    logger.info("Logging configured for MCC Classifier")
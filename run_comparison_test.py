@@ -10,79 +10,128 @@ import os
 import sys
 import logging
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from mcc_classifier.evaluator import MCCEvaluator
 from mcc_classifier.utils.logger import setup_logging
 
+# Evaluator reused across datasets within one process; built lazily so worker
+# processes construct their own agents on first use
+_evaluator = None
+
+def _get_evaluator():
+    global _evaluator
+    if _evaluator is None:
+        _evaluator = MCCEvaluator()
+    return _evaluator
+
+def _run_one(dataset, output_dir="output"):
+    """
+    Evaluate a single dataset and return its performance metrics.
+
+    Encapsulates one iteration of the comparison loop so datasets can run
+    either serially or on worker processes.
+
+    Args:
+        dataset (str): Dataset filename under the data directory.
+        output_dir (str): Directory for the output CSV.
+
+    Returns:
+        tuple: (output_file, metrics dict) for the dataset.
+    """
+    setup_logging(log_level=logging.INFO, log_to_file=True)
+
+    input_file = os.path.join("data", dataset)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = f"{output_dir}/{os.path.splitext(dataset)[0]}_comparison_{timestamp}.csv"
+
+    # Pass pass_full_data=True to ensure the agent receives all merchant data
+    metrics = _get_evaluator().evaluate(input_file, output_file, pass_full_data=True)
+    return output_file, metrics
+
+def _print_results(dataset, output_file, metrics):
+    """Print the per-dataset summary and performance table."""
+    print(f"Evaluation completed for {dataset}")
+    print(f"Results written to: {output_file}")
+
+    # Build the whole performance table and emit it with one write
+    # instead of a stdout syscall per line
+    lines = [
+        "\n| Agent    | Accuracy | Correct/Total |",
+        "|----------|----------|---------------|"
+    ]
+    for agent_name, agent_metrics in metrics.items():
+        accuracy = agent_metrics["accuracy"]
+        correct = agent_metrics["correct_classifications"]
+        total = agent_metrics["total_classifications"]
+
+        lines.append(f"| {agent_name:<8} | {accuracy:.2%}   | {correct}/{total}           |")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def run_comparison(datasets, sample_only=False):
     """
     Run MCC evaluation on multiple datasets and compare results.
-    
+
     Args:
         datasets (list): List of dataset filenames to process
         sample_only (bool): If True, only run on sample datasets
     """
     # Configure logging
     setup_logging(log_level=logging.INFO, log_to_file=True)
-    
+
+    # Create the output directory once instead of re-checking per dataset
+    output_dir = "output"
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Filter up front so the parallel path only sees runnable datasets
+    runnable = []
     for dataset in datasets:
         # Skip non-sample datasets if sample_only is True
         if sample_only and not dataset.startswith("sample_"):
             continue
-            
-        input_file = os.path.join("data", dataset)
-        
-        # Check if input file exists
-        if not os.path.exists(input_file):
-            print(f"Input file not found: {input_file}")
+
+        if not os.path.exists(os.path.join("data", dataset)):
+            print(f"Input file not found: data/{dataset}")
             continue
-        
-        # Set output file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = "output"
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        output_file = f"{output_dir}/{os.path.splitext(dataset)[0]}_comparison_{timestamp}.csv"
-        
-        # Run evaluation
+
+        runnable.append(dataset)
+
+    if len(runnable) > 1:
+        # Datasets are independent, so overlap their evaluations across
+        # worker processes; each worker builds its own evaluator once
+        with ProcessPoolExecutor(max_workers=min(len(runnable), os.cpu_count())) as executor:
+            futures = {executor.submit(_run_one, dataset): dataset for dataset in runnable}
+            for future in as_completed(futures):
+                dataset = futures[future]
+                print(f"\n=== Completed evaluation on {dataset} ===")
+                try:
+                    output_file, metrics = future.result()
+                    _print_results(dataset, output_file, metrics)
+                except Exception as e:
+                    print(f"Error during evaluation of {dataset}: {str(e)}")
+        return
+
+    for dataset in runnable:
         try:
             print(f"\n=== Running evaluation on {dataset} ===")
-            
-            evaluator = MCCEvaluator()
-            # Pass pass_full_data=True to ensure the agent receives all merchant data
-            metrics = evaluator.evaluate(input_file, output_file, pass_full_data=True)
-            
-            # Print results summary
-            print(f"Evaluation completed for {dataset}")
-            print(f"Results written to: {output_file}")
-            
-            # Print performance table header
-            print("\n| Agent    | Accuracy | Correct/Total |")
-            print("|----------|----------|---------------|")
-            
-            # Print each agent's performance
-            for agent_name, agent_metrics in metrics.items():
-                accuracy = agent_metrics["accuracy"]
-                correct = agent_metrics["correct_classifications"]
-                total = agent_metrics["total_classifications"]
-                
-                print(f"| {agent_name:<8} | {accuracy:.2%}   | {correct}/{total}           |")
-            
+            output_file, metrics = _run_one(dataset, output_dir)
+            _print_results(dataset, output_file, metrics)
         except Exception as e:
             print(f"Error during evaluation of {dataset}: {str(e)}")
 
 if __name__ == "__main__":
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description='MCC Classification Comparison Tool')
-    parser.add_argument('--sample', action='store_true', 
+    parser.add_argument('--sample', action='store_true',
                         help='Run only on sample datasets')
     args = parser.parse_args()
-    
+
     # Datasets to compare
     datasets_to_compare = [
         # "sample_merchants.csv",
         "custom_test_merchants.csv"
     ]
-    
+
     # Run comparison with the sample flag
-    run_comparison(datasets_to_compare, sample_only=args.sample) 
\ No newline at end of file
+    run_comparison(datasets_to_compare, sample_only=args.sample)
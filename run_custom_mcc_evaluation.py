@@ -30,8 +30,7 @@ def run_evaluation(input_file):
     # Set output file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_dir = "output"
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     output_file = f"{output_dir}/custom_mcc_evaluation_{timestamp}.csv"
     
     # Run evaluation
@@ -1,8 +1,8 @@
 import os
 import argparse
+import csv
 import logging
 import json
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
 
@@ -41,9 +41,12 @@ def create_test_data(output_file):
         {"Merchant Name": "Green Thumb Landscaping", "Legal Name": "Green Thumb Services", "Actual MCC code": "0780", "MCC Description": "Horticultural Services, Landscaping Services"}
     ]
     
-    # Convert to DataFrame and save to CSV
-    df = pd.DataFrame(test_data)
-    df.to_csv(output_file, index=False)
+    # The rows and column order are fixed, so write them straight through the
+    # csv module instead of round-tripping a DataFrame
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=test_data[0].keys())
+        writer.writeheader()
+        writer.writerows(test_data)
     logger.info(f"Created test data file: {output_file}")
     return output_file
 
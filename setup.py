@@ -6,7 +6,7 @@ setup(
     description="Tool to evaluate MCC classification agents",
     author="InfinitePay Team",
     packages=find_packages(),
-    python_requires=">=3.6",
+    python_requires=">=3.10",
     install_requires=[
         "pandas>=1.0.0",
         "numpy>=1.18.0",
@@ -9,10 +9,24 @@ merchants with their correct Merchant Category Codes (MCCs).
 import os
 import csv
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
+
+import numpy as np
 from mcc_classifier.agents.matheus_agent import MatheusAgent
 from mcc_classifier.utils.logger import setup_logging
 
+# Classification is dominated by LLM round-trips, so overlapping this many
+# requests at once bounds both latency and in-flight memory per batch
+MAX_WORKERS = 16
+BATCH_SIZE = 64
+
+# Output columns are fixed, so result rows can be written positionally with
+# csv.writer instead of paying DictWriter's per-row dict -> list translation
+FIELDS = ("Merchant Name", "Legal Name", "Actual MCC", "Actual MCC Description",
+          "Suggested MCC", "Suggested MCC Description", "Confidence", "Is Correct")
+
 def test_matheus_agent(input_file):
     """
     Test MatheusAgent on the specified input file.
@@ -39,89 +53,113 @@ def test_matheus_agent(input_file):
     # Initialize the agent
     agent = MatheusAgent()
     
-    # Read input data
-    merchants = []
-    try:
-        with open(input_file, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                merchants.append(row)
-    except Exception as e:
-        print(f"Error reading input file: {str(e)}")
-        return
-    
-    # Process merchants
-    results = []
+    # Stream rows through read -> classify -> write in one pass so peak memory
+    # stays constant regardless of input size
     correct_count = 0
     total_count = 0
-    
-    for merchant in merchants:
-        merchant_name = merchant.get("Merchant Name", "")
-        legal_name = merchant.get("Legal Name", "")
-        actual_mcc = merchant.get("Actual MCC code", "")
-        mcc_description = merchant.get("MCC Description", "")
-        
-        if not merchant_name or not actual_mcc:
-            print(f"Skipping row with missing data: {merchant}")
-            continue
-        
-        print(f"\nProcessing: {merchant_name}")
-        
-        # Classify merchant
+    writer = None
+
+    def classify_merchant(merchant):
+        """Classify one merchant, returning the raised exception on failure."""
         try:
-            result = agent.classify(merchant_name, legal_name)
-            
-            # Check if correct
-            is_correct = str(result["mcc_code"]).strip() == str(actual_mcc).strip()
-            if is_correct:
-                correct_count += 1
-            total_count += 1
-            
-            # Store result
-            results.append({
-                "Merchant Name": merchant_name,
-                "Legal Name": legal_name,
-                "Actual MCC": actual_mcc, 
-                "Actual MCC Description": mcc_description,
-                "Suggested MCC": result["mcc_code"],
-                "Suggested MCC Description": result["mcc_description"],
-                "Confidence": result["confidence"],
-                "Is Correct": "Yes" if is_correct else "No"
-            })
-            
-            # Print result
-            print(f"  Actual MCC: {actual_mcc} ({mcc_description})")
-            print(f"  Suggested MCC: {result['mcc_code']} ({result['mcc_description']})")
-            print(f"  Confidence: {result['confidence']}")
-            print(f"  Correct: {'Yes' if is_correct else 'No'}")
-            
-            # Print analysis if available
-            if "analysis" in result:
-                print("  Analysis:")
-                for point in result["analysis"]:
-                    print(f"    - {point}")
-                    
+            return agent.classify(merchant.get("Merchant Name", ""), merchant.get("Legal Name", ""))
         except Exception as e:
-            logger.error(f"Error classifying merchant {merchant_name}: {str(e)}")
-            print(f"  Error: {str(e)}")
-    
+            return e
+
+    try:
+        with open(input_file, 'r', newline='', encoding='utf-8', buffering=1 << 20) as fin, \
+             open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as fout, \
+             ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+
+            def valid_rows():
+                for merchant in csv.DictReader(fin):
+                    if not merchant.get("Merchant Name", "") or not merchant.get("Actual MCC code", ""):
+                        print(f"Skipping row with missing data: {merchant}")
+                        continue
+                    yield merchant
+
+            # Classify a bounded batch at a time: the thread pool overlaps
+            # the LLM round-trips while results stay in input order and only
+            # one batch of rows is in flight
+            rows = valid_rows()
+            while True:
+                batch = list(islice(rows, BATCH_SIZE))
+                if not batch:
+                    break
+
+                results = list(executor.map(classify_merchant, batch))
+
+                # One vectorized strip/compare per batch instead of a Python
+                # str()+strip()+== per merchant
+                actuals = [m.get("Actual MCC code", "") for m, r in zip(batch, results)
+                           if not isinstance(r, Exception)]
+                suggesteds = [r["mcc_code"] for r in results if not isinstance(r, Exception)]
+                correct_mask = (np.char.strip(np.asarray(actuals, dtype=str))
+                                == np.char.strip(np.asarray(suggesteds, dtype=str)))
+                correct_count += int(correct_mask.sum())
+                total_count += int(correct_mask.size)
+                mask_iter = iter(correct_mask.tolist())
+
+                batch_rows = []
+                for merchant, result in zip(batch, results):
+                    merchant_name = merchant.get("Merchant Name", "")
+                    legal_name = merchant.get("Legal Name", "")
+                    actual_mcc = merchant.get("Actual MCC code", "")
+                    mcc_description = merchant.get("MCC Description", "")
+
+                    print(f"\nProcessing: {merchant_name}")
+
+                    if isinstance(result, Exception):
+                        logger.error(f"Error classifying merchant {merchant_name}: {str(result)}")
+                        print(f"  Error: {str(result)}")
+                        continue
+
+                    is_correct = next(mask_iter)
+
+                    # Positional tuple in FIELDS order
+                    batch_rows.append((
+                        merchant_name,
+                        legal_name,
+                        actual_mcc,
+                        mcc_description,
+                        result["mcc_code"],
+                        result["mcc_description"],
+                        result["confidence"],
+                        "Yes" if is_correct else "No"
+                    ))
+
+                    # Print result
+                    print(f"  Actual MCC: {actual_mcc} ({mcc_description})")
+                    print(f"  Suggested MCC: {result['mcc_code']} ({result['mcc_description']})")
+                    print(f"  Confidence: {result['confidence']}")
+                    print(f"  Correct: {'Yes' if is_correct else 'No'}")
+
+                    # Print analysis if available
+                    if "analysis" in result:
+                        print("  Analysis:")
+                        for point in result["analysis"]:
+                            print(f"    - {point}")
+
+                # One writerows call per batch; the header goes out before
+                # the first batch
+                if batch_rows:
+                    if writer is None:
+                        writer = csv.writer(fout)
+                        writer.writerow(FIELDS)
+                    writer.writerows(batch_rows)
+    except Exception as e:
+        print(f"Error processing input file: {str(e)}")
+        return
+
     # Calculate accuracy
     accuracy = correct_count / total_count if total_count > 0 else 0
     print(f"\nOverall accuracy: {accuracy:.2%} ({correct_count}/{total_count})")
-    
-    # Write results to CSV
-    try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            if results:
-                writer = csv.DictWriter(f, fieldnames=results[0].keys())
-                writer.writeheader()
-                writer.writerows(results)
-                print(f"Results written to: {output_file}")
-            else:
-                print("No results to write to file.")
-    except Exception as e:
-        print(f"Error writing output file: {str(e)}")
-    
+
+    if writer is not None:
+        print(f"Results written to: {output_file}")
+    else:
+        print("No results to write to file.")
+
 if __name__ == "__main__":
     # Run test on custom test data
     test_matheus_agent("data/custom_test_merchants.csv") 
\ No newline at end of file